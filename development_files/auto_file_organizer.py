@@ -5,40 +5,75 @@ Monitors Downloads folder and automatically organizes files into categories.
 """
 
 import os
+import re
 import sys
+import stat
 import time
+import queue
+import atexit
 import shutil
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from random_forest_classifier import RandomForestFileClassifier
+from random_forest_classifier import RandomForestFileClassifier, COMPILED_MODEL_SUFFIX
+
+_log_listener: Optional[QueueListener] = None
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Send log records through a queue to the file and console handlers.
+    
+    Worker threads only enqueue records; formatting and I/O happen on the
+    listener thread. Per-file messages are logged at DEBUG and only emitted
+    when verbose is set. Safe to call more than once.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    if _log_listener is not None:
+        if verbose:
+            root.setLevel(logging.DEBUG)
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler('file_organizer.log'), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    
+    _log_listener = QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 
 class FileOrganizerHandler(FileSystemEventHandler):
     """Handles file system events for automatic organization."""
     
-    def __init__(self, downloads_path: str, classifier_model_path: str = "rf_file_classifier.joblib"):
+    def __init__(self, downloads_path: str, classifier_model_path: str = "rf_file_classifier.joblib",
+                 verbose: bool = False):
         """
         Initialize the file organizer handler.
         
         Args:
             downloads_path: Path to Downloads folder to monitor
             classifier_model_path: Path to trained classifier model
+            verbose: Log every processed file (DEBUG level)
         """
         self.downloads_path = Path(downloads_path)
         self.classifier = RandomForestFileClassifier()
         self.existing_folders: Set[str] = set()
+        self._folder_by_lower: Dict[str, str] = {}  # lowercased name -> real folder name
         
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('file_organizer.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        configure_logging(verbose)
         self.logger = logging.getLogger(__name__)
         
         # Load classifier
@@ -46,6 +81,14 @@ class FileOrganizerHandler(FileSystemEventHandler):
             if os.path.exists(classifier_model_path):
                 self.classifier.load_model(classifier_model_path)
                 self.logger.info(f"✅ Classifier loaded from {classifier_model_path}")
+                
+                # Prefer a compiled or ONNX export next to the joblib model when available
+                lib_path = str(Path(classifier_model_path).with_suffix(COMPILED_MODEL_SUFFIX))
+                onnx_path = str(Path(classifier_model_path).with_suffix('.onnx'))
+                if self.classifier.load_compiled(lib_path):
+                    self.logger.info(f"⚡ Using compiled model: {lib_path}")
+                elif self.classifier.load_onnx(onnx_path):
+                    self.logger.info(f"⚡ Using ONNX Runtime model: {onnx_path}")
             else:
                 self.logger.error(f"❌ Model file not found: {classifier_model_path}")
                 raise FileNotFoundError(f"Model file not found: {classifier_model_path}")
@@ -58,13 +101,39 @@ class FileOrganizerHandler(FileSystemEventHandler):
         
         # Files to ignore (temporary, system files, etc.)
         self.ignore_patterns = {
-            '.tmp', '.temp', '.crdownload', '.part', '.downloading',
+            '.tmp', '.temp', '.crdownload', '.part', '.downloading', '.download',
             '.DS_Store', 'Thumbs.db', '.gitkeep', '.placeholder'
         }
         
+        # Precomputed lookups so the per-event checks stay in C
+        self._ignore_exts = frozenset(p.lower() for p in self.ignore_patterns if p.startswith('.'))
+        self._ignore_names = frozenset(self.ignore_patterns)
+        self._ignore_suffixes = tuple(self.ignore_patterns)
+        
         # Minimum file size to process (avoid processing incomplete downloads)
         self.min_file_size = 1024  # 1KB
         
+        # Statistics log stays open (line buffered) for the handler's lifetime
+        self._stats_fh = open('organized_files.log', 'a', buffering=1)
+        self._stats_lock = threading.Lock()
+        
+        # Event debouncing: new files are collected until the folder has been
+        # quiet for debounce_seconds, then polled until their sizes stop
+        # changing and classified together in one batch
+        self.debounce_seconds = 0.5
+        self.stable_poll_interval = 0.25
+        self.max_settle_seconds = 10.0
+        self.max_batch_size = 500
+        self._event_queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self._batch_thread = threading.Thread(target=self._batch_loop, daemon=True)
+        self._batch_thread.start()
+        
+        # File moves run on their own thread so disk I/O never blocks classification
+        self._move_queue: "queue.Queue[Optional[Tuple[Path, str, float]]]" = queue.Queue(maxsize=10_000)
+        self._next_counter: Dict[Tuple[str, str, str], int] = {}  # conflict suffix cache
+        self._mover_thread = threading.Thread(target=self._mover_loop, daemon=True)
+        self._mover_thread.start()
+        
         self.logger.info(f"🎯 File Organizer initialized for: {self.downloads_path}")
         self.logger.info(f"📁 Found existing folders: {', '.join(sorted(self.existing_folders))}")
     
@@ -74,30 +143,46 @@ class FileOrganizerHandler(FileSystemEventHandler):
             self.logger.warning(f"Downloads path does not exist: {self.downloads_path}")
             return
         
-        for item in self.downloads_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                self.existing_folders.add(item.name)
-                self.logger.info(f"📂 Found existing folder: {item.name}")
+        # DirEntry.is_dir() reuses the type returned by the directory read
+        with os.scandir(self.downloads_path) as it:
+            for entry in it:
+                if not entry.name.startswith('.') and entry.is_dir():
+                    self._add_existing_folder(entry.name)
+                    self.logger.debug("📂 Found existing folder: %s", entry.name)
     
-    def _should_ignore_file(self, file_path: Path) -> bool:
-        """Check if file should be ignored."""
+    def _add_existing_folder(self, folder_name: str):
+        """Record a folder in both the name set and the lowercase index."""
+        self.existing_folders.add(folder_name)
+        self._folder_by_lower.setdefault(folder_name.lower(), folder_name)
+    
+    @staticmethod
+    def _stat(file_path) -> Optional[os.stat_result]:
+        """Return os.stat() for a path, or None if it has vanished."""
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+    
+    def _should_ignore_file(self, name: str, st: Optional[os.stat_result]) -> bool:
+        """Check if file should be ignored, given its name and a single stat result."""
         # Check file extension
-        if file_path.suffix.lower() in self.ignore_patterns:
+        if os.path.splitext(name)[1].lower() in self._ignore_exts:
             return True
         
         # Check filename
-        if file_path.name in self.ignore_patterns:
+        if name in self._ignore_names:
+            return True
+        
+        # File disappeared or cannot be read
+        if st is None:
             return True
         
         # Check if it's a directory
-        if file_path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             return True
         
         # Check file size (avoid incomplete downloads)
-        try:
-            if file_path.stat().st_size < self.min_file_size:
-                return True
-        except OSError:
+        if st.st_size < self.min_file_size:
             return True
         
         return False
@@ -106,32 +191,31 @@ class FileOrganizerHandler(FileSystemEventHandler):
         """Get existing folder or create new one if needed."""
         folder_path = self.downloads_path / folder_name
         
-        # Check if exact folder exists
-        if folder_path.exists():
+        # Check if exact folder exists (the stat only runs for names the
+        # index doesn't know, e.g. a folder created by another program)
+        if folder_name in self.existing_folders or folder_path.exists():
             return folder_path
         
         # Check for similar existing folders (case-insensitive)
-        for existing_folder in self.existing_folders:
-            if existing_folder.lower() == folder_name.lower():
-                existing_path = self.downloads_path / existing_folder
-                self.logger.info(f"📁 Using existing folder: {existing_folder}")
-                return existing_path
+        folder_name_lower = folder_name.lower()
+        existing_folder = self._folder_by_lower.get(folder_name_lower)
+        if existing_folder is not None:
+            existing_path = self.downloads_path / existing_folder
+            self.logger.debug("📁 Using existing folder: %s", existing_folder)
+            return existing_path
         
         # Check for partial matches (e.g., "Education" vs "Education and Finance")
-        folder_name_lower = folder_name.lower()
-        for existing_folder in self.existing_folders:
-            existing_lower = existing_folder.lower()
-            
+        for existing_lower, existing_folder in self._folder_by_lower.items():
             # If new folder name contains existing folder name or vice versa
             if (folder_name_lower in existing_lower or existing_lower in folder_name_lower):
                 existing_path = self.downloads_path / existing_folder
-                self.logger.info(f"📁 Using similar existing folder: {existing_folder} (for {folder_name})")
+                self.logger.debug("📁 Using similar existing folder: %s (for %s)", existing_folder, folder_name)
                 return existing_path
         
         # Create new folder
         try:
             folder_path.mkdir(exist_ok=True)
-            self.existing_folders.add(folder_name)
+            self._add_existing_folder(folder_name)
             self.logger.info(f"📁 Created new folder: {folder_name}")
             return folder_path
         except Exception as e:
@@ -139,49 +223,234 @@ class FileOrganizerHandler(FileSystemEventHandler):
             # Fallback to Downloads root
             return self.downloads_path
     
-    def _organize_file(self, file_path: Path):
-        """Organize a single file."""
-        try:
-            # Skip if file should be ignored
-            if self._should_ignore_file(file_path):
-                return
+    def _organize_files_batch(self, entries: List[Tuple[Path, Optional[os.stat_result]]]) -> int:
+        """
+        Organize several files with a single classifier call.
+        
+        Args:
+            entries: Candidate (path, stat) pairs; ignored files are filtered out first
             
-            self.logger.info(f"🔍 Processing file: {file_path.name}")
+        Returns:
+            Number of files that were classified and handed to the mover
+        """
+        files = [f for f, st in entries if not self._should_ignore_file(f.name, st)]
+        if not files:
+            return 0
+        
+        # Unambiguous extensions skip the classifier; the rest go in one batch
+        results = [self.classifier.predict_from_extension(str(f)) for f in files]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            self.logger.debug("🔍 Classifying %d files in one batch", len(pending))
+            batch_results = self.classifier.predict_batch(
+                [str(files[i]) for i in pending], use_cache=True
+            )
+            for i, result in zip(pending, batch_results):
+                results[i] = result
+        
+        organized_count = 0
+        for file_path, result in zip(files, results):
+            if 'error' in result:
+                self.logger.error("❌ Error processing %s: %s", file_path.name, result['error'])
+                continue
+            try:
+                self._move_classified_file(file_path, result)
+                organized_count += 1
+            except Exception as e:
+                self.logger.error("❌ Error processing %s: %s", file_path.name, e)
+        
+        return organized_count
+    
+    def _move_classified_file(self, file_path: Path, result: Dict):
+        """Queue a classified file for the mover thread."""
+        folder_name = result.get('folder_name', result['predicted_category'])
+        confidence = result['confidence']
+        
+        route = result.get('route', 'rf')
+        self.logger.debug("🎯 Predicted: %s (confidence: %.3f, route=%s)", folder_name, confidence, route)
+        self._move_queue.put((file_path, folder_name, confidence))
+    
+    def _mover_loop(self):
+        """Perform queued file moves one at a time."""
+        while True:
+            item = self._move_queue.get()
+            if item is None:
+                break
+            try:
+                self._move_file(*item)
+            except Exception as e:
+                self.logger.error("❌ Error processing %s: %s", item[0].name, e)
+    
+    def _move_file(self, file_path: Path, folder_name: str, confidence: float):
+        """Move a file into its category folder, resolving name conflicts."""
+        # Get or create target folder
+        target_folder = self._get_or_create_folder(folder_name)
+        target_path = target_folder / file_path.name
+        
+        # Handle filename conflicts by atomically claiming a free name
+        target_path = self._claim_target(target_path)
+        
+        # Move file
+        try:
+            try:
+                # Same filesystem: one atomic rename over the placeholder
+                os.replace(file_path, target_path)
+            except OSError:
+                # Different device or rename refused: copy + unlink
+                shutil.move(str(file_path), str(target_path))
+            self.logger.debug("✅ Moved %s → %s/", file_path.name, target_folder.name)
             
-            # Get prediction from classifier
-            result = self.classifier.predict(str(file_path))
-            folder_name = result.get('folder_name', result['predicted_category'])
-            confidence = result['confidence']
+            # Log to separate success file for statistics
+            line = f"{time.strftime('%Y-%m-%d %H:%M:%S')},{file_path.name},{folder_name},{confidence:.3f}\n"
+            with self._stats_lock:
+                self._stats_fh.write(line)
+                
+        except Exception as e:
+            self.logger.error("❌ Failed to move %s: %s", file_path.name, e)
+            # Release the claimed name
+            try:
+                os.unlink(target_path)
+            except OSError:
+                pass
+    
+    def _claim_target(self, target_path: Path) -> Path:
+        """
+        Reserve a free destination name with O_CREAT | O_EXCL.
+        
+        An empty placeholder is created so no other writer can take the name
+        between the check and the move; the move then replaces it. On the
+        first conflict for a name the folder is scanned once for the highest
+        existing stem_N suffix, and the next counter is remembered so later
+        conflicts for the same name need a single probe.
+        
+        Args:
+            target_path: Preferred destination path
             
-            self.logger.info(f"🎯 Predicted: {folder_name} (confidence: {confidence:.3f})")
+        Returns:
+            The claimed path (target_path, or stem_N.suffix on conflict)
+        """
+        folder, stem, suffix = target_path.parent, target_path.stem, target_path.suffix
+        key = (str(folder), stem, suffix)
+        candidate = target_path
+        counter = self._next_counter.get(key)
+        if counter is not None:
+            candidate = folder / f"{stem}_{counter}{suffix}"
+        
+        while True:
+            try:
+                os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                if counter is not None:
+                    self._next_counter[key] = counter + 1
+                return candidate
+            except FileExistsError:
+                if counter is None:
+                    counter = self._highest_suffix(folder, stem, suffix) + 1
+                else:
+                    counter += 1
+                candidate = folder / f"{stem}_{counter}{suffix}"
+    
+    @staticmethod
+    def _highest_suffix(folder: Path, stem: str, suffix: str) -> int:
+        """Return the largest N among stem_N.suffix files in folder (0 if none)."""
+        pattern = re.compile(rf"^{re.escape(stem)}(?:_(\d+))?{re.escape(suffix)}$")
+        highest = 0
+        with os.scandir(folder) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match and match.group(1):
+                    highest = max(highest, int(match.group(1)))
+        return highest
+    
+    def _batch_loop(self):
+        """Collect queued events and organize them in debounced batches."""
+        pending: "OrderedDict[Path, None]" = OrderedDict()
+        last_arrival = 0.0
+        
+        while True:
+            try:
+                file_path = self._event_queue.get(timeout=self.stable_poll_interval)
+                if file_path is None:
+                    break
+                # Deduplicate create + move events for the same file
+                pending[file_path] = None
+                last_arrival = time.monotonic()
+                if len(pending) < self.max_batch_size:
+                    continue
+            except queue.Empty:
+                pass
             
-            # Get or create target folder
-            target_folder = self._get_or_create_folder(folder_name)
-            target_path = target_folder / file_path.name
+            if not pending:
+                continue
+            if (len(pending) < self.max_batch_size
+                    and time.monotonic() - last_arrival < self.debounce_seconds):
+                continue
             
-            # Handle filename conflicts
-            counter = 1
-            original_target = target_path
-            while target_path.exists():
-                stem = original_target.stem
-                suffix = original_target.suffix
-                target_path = original_target.parent / f"{stem}_{counter}{suffix}"
-                counter += 1
+            # Skip temporary download names without polling them
+            candidates = [p for p in pending
+                          if os.path.splitext(p.name)[1].lower() not in self._ignore_exts
+                          and p.name not in self._ignore_names]
+            pending.clear()
             
-            # Move file
+            # Stat each settled file once; vanished files are dropped by the ignore check
+            batch = [(p, self._stat(p)) for p in self._settled_files(candidates)]
             try:
-                shutil.move(str(file_path), str(target_path))
-                self.logger.info(f"✅ Moved {file_path.name} → {target_folder.name}/")
-                
-                # Log to separate success file for statistics
-                with open('organized_files.log', 'a') as f:
-                    f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')},{file_path.name},{folder_name},{confidence:.3f}\n")
-                    
+                self._organize_files_batch(batch)
             except Exception as e:
-                self.logger.error(f"❌ Failed to move {file_path.name}: {e}")
-                
-        except Exception as e:
-            self.logger.error(f"❌ Error processing {file_path.name}: {e}")
+                self.logger.error("❌ Error organizing batch: %s", e)
+    
+    def _settled_files(self, paths: List[Path]) -> List[Path]:
+        """
+        Poll file sizes until they stop changing.
+        
+        All paths are sampled together every stable_poll_interval. A file is
+        settled once two consecutive samples match; an empty file counts too and
+        is dropped later by the minimum-size check. Polling
+        stops as soon as some files settle (or after max_settle_seconds), and
+        files that are still growing are re-queued for a later batch.
+        
+        Args:
+            paths: Newly created files
+            
+        Returns:
+            Files whose size is stable
+        """
+        sizes = {}
+        for p in paths:
+            st = self._stat(p)
+            if st is not None:
+                sizes[p] = st.st_size
+        
+        settled = []
+        deadline = time.monotonic() + self.max_settle_seconds
+        while sizes and not settled and time.monotonic() < deadline:
+            time.sleep(self.stable_poll_interval)
+            growing = {}
+            for p, previous in sizes.items():
+                st = self._stat(p)
+                if st is None:
+                    continue  # Vanished (e.g. renamed by the browser)
+                if st.st_size == previous:
+                    settled.append(p)
+                else:
+                    growing[p] = st.st_size
+            sizes = growing
+        
+        for p in sizes:
+            self._event_queue.put(p)
+        
+        return settled
+    
+    def close(self):
+        """Stop the worker threads, letting queued moves finish first."""
+        self._event_queue.put(None)
+        # No timeout: a batch may still be settling (up to max_settle_seconds)
+        # and its moves must be queued ahead of the mover's sentinel
+        self._batch_thread.join()
+        self._move_queue.put(None)
+        self._mover_thread.join()
+        
+        with self._stats_lock:
+            self._stats_fh.close()
     
     def on_created(self, event):
         """Handle file creation events."""
@@ -190,15 +459,9 @@ class FileOrganizerHandler(FileSystemEventHandler):
         
         file_path = Path(event.src_path)
         
-        # Wait a bit to ensure file is completely downloaded
-        time.sleep(2)
-        
-        # Check if file still exists and is complete
-        if not file_path.exists():
-            return
-        
-        self.logger.info(f"📥 New file detected: {file_path.name}")
-        self._organize_file(file_path)
+        # Queue the file; the batch worker waits for it to settle
+        self.logger.debug("📥 New file detected: %s", file_path.name)
+        self._event_queue.put(file_path)
     
     def on_moved(self, event):
         """Handle file move events (e.g., browser completing download)."""
@@ -208,21 +471,24 @@ class FileOrganizerHandler(FileSystemEventHandler):
         file_path = Path(event.dest_path)
         
         # Some browsers move files when download completes
-        if file_path.exists() and not any(pattern in file_path.name for pattern in self.ignore_patterns):
-            self.logger.info(f"📦 File completed download: {file_path.name}")
-            self._organize_file(file_path)
+        name = file_path.name
+        if file_path.exists() and not (name in self._ignore_names or name.endswith(self._ignore_suffixes)):
+            self.logger.debug("📦 File completed download: %s", file_path.name)
+            self._event_queue.put(file_path)
 
 
 class AutoFileOrganizer:
     """Main class for automatic file organization."""
     
-    def __init__(self, downloads_path: str = None, model_path: str = "rf_file_classifier.joblib"):
+    def __init__(self, downloads_path: str = None, model_path: str = "rf_file_classifier.joblib",
+                 verbose: bool = False):
         """
         Initialize the auto file organizer.
         
         Args:
             downloads_path: Path to Downloads folder (default: ~/Downloads)
             model_path: Path to classifier model
+            verbose: Log every processed file (DEBUG level)
         """
         # Use default Downloads folder if not specified
         if downloads_path is None:
@@ -232,12 +498,10 @@ class AutoFileOrganizer:
         self.model_path = model_path
         self.observer = None
         self.handler = None
+        self.verbose = verbose
         
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        configure_logging(verbose)
         self.logger = logging.getLogger(__name__)
     
     def organize_existing_files(self):
@@ -248,11 +512,18 @@ class AutoFileOrganizer:
             self.logger.error(f"Downloads folder does not exist: {self.downloads_path}")
             return
         
-        organized_count = 0
+        queued_count = 0
         
         # Get all files in Downloads (excluding subdirectories)
-        files = [f for f in self.downloads_path.iterdir() 
-                if f.is_file() and not f.name.startswith('.')]
+        files = []
+        with os.scandir(self.downloads_path) as it:
+            for entry in it:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                try:
+                    files.append((Path(entry.path), entry.stat()))
+                except OSError:
+                    continue
         
         if not files:
             self.logger.info("📂 No files to organize in Downloads folder")
@@ -260,20 +531,20 @@ class AutoFileOrganizer:
         
         self.logger.info(f"📋 Found {len(files)} files to organize")
         
-        for file_path in files:
-            try:
-                self.handler._organize_file(file_path)
-                organized_count += 1
-            except Exception as e:
-                self.logger.error(f"❌ Failed to organize {file_path.name}: {e}")
+        # Classify everything in one pass; the mover thread does the moves
+        # and logs each one (or its failure) as it happens
+        try:
+            queued_count = self.handler._organize_files_batch(files)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to organize existing files: {e}")
         
-        self.logger.info(f"✅ Organized {organized_count} existing files")
+        self.logger.info(f"📦 Queued {queued_count} existing files for moving")
     
     def start_monitoring(self, organize_existing: bool = True):
         """Start monitoring the Downloads folder."""
         try:
             # Create handler
-            self.handler = FileOrganizerHandler(str(self.downloads_path), self.model_path)
+            self.handler = FileOrganizerHandler(str(self.downloads_path), self.model_path, self.verbose)
             
             # Organize existing files if requested
             if organize_existing:
@@ -304,6 +575,8 @@ class AutoFileOrganizer:
             self.observer.stop()
             self.observer.join()
             self.logger.info("🛑 Stopped monitoring Downloads folder")
+        if self.handler:
+            self.handler.close()
 
 
 def main():
@@ -336,17 +609,20 @@ The organizer will:
                        help='Skip organizing existing files')
     parser.add_argument('--test', action='store_true',
                        help='Test mode - organize existing files only (no monitoring)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Log every processed file')
     
     args = parser.parse_args()
     
     try:
         # Initialize organizer
-        organizer = AutoFileOrganizer(args.path, args.model)
+        organizer = AutoFileOrganizer(args.path, args.model, args.verbose)
         
         if args.test:
             # Test mode - just organize existing files
-            organizer.handler = FileOrganizerHandler(str(organizer.downloads_path), args.model)
+            organizer.handler = FileOrganizerHandler(str(organizer.downloads_path), args.model, args.verbose)
             organizer.organize_existing_files()
+            organizer.handler.close()
         else:
             # Normal mode - start monitoring
             organizer.start_monitoring(organize_existing=not args.no_existing)
@@ -6,9 +6,11 @@ Organizes files in Downloads folder automatically using AI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import errno
 import os
 import sys
 import threading
+import time
 import shutil
 from pathlib import Path
 from random_forest_classifier import RandomForestFileClassifier
@@ -21,9 +23,16 @@ class SimpleFileOrganizerGUI:
         self.root.configure(bg='#f0f0f0')
         self.root.resizable(True, True)  # Allow resizing so user can see all elements
         
-        # Initialize classifier
+        # Initialize classifier; the model is deserialized on a background
+        # thread so the window shows up right away
         self.classifier = None
-        self.load_classifier()
+        self._classifier_error = None
+        self._classifier_ready = threading.Event()
+        self._folder_index = {}  # Filled by _scan_folders() for each organize run
+        self._folder_names = set()
+        self._dest_counters = {}  # (folder, base name, ext) -> next free counter
+        self._status_file = ''  # Latest file name for the status label
+        threading.Thread(target=self.load_classifier, daemon=True).start()
         
         # Default to Downloads folder
         self.downloads_path = str(Path.home() / "Downloads")
@@ -31,10 +40,20 @@ class SimpleFileOrganizerGUI:
         # Create GUI
         self.create_widgets()
         
+        # Keep the organize button disabled until the model is in
+        self.organize_btn.config(state='disabled', text="Loading model...", bg='#95a5a6')
+        self.status_label.config(text="Loading classifier...", fg='#3498db')
+        self._check_classifier()
+        
     def load_classifier(self):
-        """Load the trained Random Forest classifier."""
+        """
+        Load the trained Random Forest classifier.
+        
+        Runs off the Tk thread: it only sets attributes, and
+        _check_classifier reports the outcome from the main loop.
+        """
         try:
-            self.classifier = RandomForestFileClassifier()
+            classifier = RandomForestFileClassifier()
             
             # Get the correct path for the model file
             if getattr(sys, 'frozen', False):
@@ -46,12 +65,26 @@ class SimpleFileOrganizerGUI:
                 model_path = 'rf_file_classifier.joblib'
             
             if os.path.exists(model_path):
-                self.classifier.load_model(model_path)
+                classifier.load_model(model_path)
+                self.classifier = classifier
                 print("✅ Classifier loaded successfully")
             else:
-                messagebox.showerror("Error", f"Model file not found at: {model_path}")
+                self._classifier_error = f"Model file not found at: {model_path}"
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load classifier: {e}")
+            self._classifier_error = f"Failed to load classifier: {e}"
+        finally:
+            self._classifier_ready.set()
+    
+    def _check_classifier(self):
+        """Poll the background model load and enable organizing when done."""
+        if not self._classifier_ready.is_set():
+            self.root.after(100, self._check_classifier)
+            return
+        
+        self.organize_btn.config(state='normal', text="🚀 Organize Files", bg='#27ae60')
+        self.status_label.config(text="Ready to organize files", fg='#7f8c8d')
+        if self._classifier_error:
+            messagebox.showerror("Error", self._classifier_error)
     
     def create_widgets(self):
         """Create simple GUI widgets."""
@@ -183,10 +216,9 @@ class SimpleFileOrganizerGUI:
     def count_files(self):
         """Count files in the selected folder."""
         try:
-            if os.path.exists(self.downloads_path):
-                files = [f for f in os.listdir(self.downloads_path) 
-                        if os.path.isfile(os.path.join(self.downloads_path, f))]
-                return len(files)
+            # DirEntry knows its type, so no stat per entry
+            with os.scandir(self.downloads_path) as entries:
+                return sum(1 for entry in entries if entry.is_file(follow_symlinks=False))
         except:
             pass
         return 0
@@ -214,48 +246,91 @@ class SimpleFileOrganizerGUI:
     def _organize_worker(self):
         """Worker thread for file organization."""
         try:
-            # Get all files in the folder
-            files = []
-            for item in os.listdir(self.downloads_path):
-                item_path = os.path.join(self.downloads_path, item)
-                if os.path.isfile(item_path):
-                    files.append(item_path)
+            # Get all files in the folder, smallest first so a huge download
+            # early in directory order doesn't stall visible progress
+            sized = []
+            with os.scandir(self.downloads_path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            size = 0
+                        sized.append((size, entry.path, entry.name))
+            sized.sort()
+            files = [(file_path, filename) for _, file_path, filename in sized]
             
             if not files:
-                self.root.after(0, lambda: self._show_completion("No files to organize!"))
+                self.root.after(0, lambda: self._show_completion("No files to organize!", remaining=0))
                 return
             
+            # Index existing subfolders once instead of re-listing per file
+            self._scan_folders()
+            self._dest_counters = {}
+            
             # Create organized folders
             organized_count = 0
             categories = set()
             
-            for i, file_path in enumerate(files):
+            # Classify all files with one forest evaluation; features are
+            # gathered on a few threads so slow stats (network drives) overlap
+            results = self.classifier.predict_batch(
+                [file_path for file_path, _ in files],
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            )
+            
+            # Files keep their size order; each target folder is resolved once
+            planned = []
+            for (file_path, filename), result in zip(files, results):
+                if 'error' in result:
+                    print(f"Error organizing {file_path}: {result['error']}")
+                    continue
+                folder_name = result.get('folder_name', result['predicted_category'])
+                planned.append((file_path, filename, folder_name))
+                categories.add(folder_name)
+            
+            # Smart folder management - check for existing similar folders.
+            # Separator-terminated once per folder; names are appended
+            dest_dirs = {folder_name: os.path.join(self._get_or_create_folder(folder_name), '')
+                         for folder_name in sorted(categories)}
+            
+            last_status_ts = 0.0
+            last_index = len(planned) - 1
+            
+            # Local bindings for the per-file loop
+            monotonic = time.monotonic
+            replace = os.replace
+            claim_destination = self._claim_destination
+            
+            for i, (file_path, filename, folder_name) in enumerate(planned):
                 try:
-                    # Update status
-                    self.root.after(0, lambda f=os.path.basename(file_path): 
-                                   self.status_label.config(text=f"Processing: {f[:30]}..."))
-                    
-                    # Classify file
-                    result = self.classifier.predict(file_path)
-                    category = result['predicted_category']
-                    folder_name = result.get('folder_name', category)
-                    categories.add(folder_name)
-                    
-                    # Smart folder management - check for existing similar folders
-                    category_folder = self._get_or_create_folder(folder_name)
-                    
-                    # Move file to category folder
-                    destination = os.path.join(category_folder, os.path.basename(file_path))
+                    # Update status; the label reads the latest name when Tk
+                    # gets to it, so at most ~20 callbacks per second are queued
+                    self._status_file = filename
+                    now = monotonic()
+                    if now - last_status_ts > 0.05 or i == last_index:
+                        last_status_ts = now
+                        self.root.after(0, self._show_status_file)
                     
-                    # Handle name conflicts
-                    counter = 1
-                    base_name, ext = os.path.splitext(os.path.basename(file_path))
-                    while os.path.exists(destination):
-                        new_name = f"{base_name}_{counter}{ext}"
-                        destination = os.path.join(category_folder, new_name)
-                        counter += 1
+                    # Move file to category folder, handling name conflicts
+                    destination = claim_destination(dest_dirs[folder_name], filename)
                     
-                    shutil.move(file_path, destination)
+                    # Same filesystem in practice: a single rename syscall
+                    # that replaces the claimed placeholder
+                    try:
+                        try:
+                            replace(file_path, destination)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(file_path, destination)
+                    except Exception:
+                        # Release the claimed name
+                        try:
+                            os.unlink(destination)
+                        except OSError:
+                            pass
+                        raise
                     organized_count += 1
                     
                 except Exception as e:
@@ -266,44 +341,98 @@ class SimpleFileOrganizerGUI:
             message = f"✅ Successfully organized {organized_count} files into {len(categories)} categories:\n"
             message += ", ".join(sorted(categories))
             
-            self.root.after(0, lambda: self._show_completion(message))
+            # Files left behind are the ones that failed; no need to rescan
+            remaining = len(files) - organized_count
+            self.root.after(0, lambda: self._show_completion(message, remaining))
             
         except Exception as e:
             self.root.after(0, lambda: self._show_completion(f"❌ Error: {e}"))
     
-    def _show_completion(self, message):
-        """Show completion message and reset UI."""
+    def _show_status_file(self):
+        """Show the file the worker is currently processing."""
+        self.status_label.config(text=f"Processing: {self._status_file[:30]}...")
+    
+    def _show_completion(self, message, remaining=None):
+        """
+        Show completion message and reset UI.
+        
+        Args:
+            message: Text for the completion dialog
+            remaining: Files left in the folder, if known; rescans otherwise
+        """
+        if remaining is None:
+            remaining = self.count_files()
+        
         self.progress.stop()
         self.organize_btn.config(state='normal', text="🚀 Organize Files", bg='#27ae60')
         self.status_label.config(text="Ready to organize files", fg='#7f8c8d')
-        self.stats_label.config(text=f"📊 Files in folder: {self.count_files()}")
+        self.stats_label.config(text=f"📊 Files in folder: {remaining}")
         
         messagebox.showinfo("Organization Complete", message)
     
+    def _claim_destination(self, dest_dir: str, filename: str) -> str:
+        """
+        Reserve a free destination name with O_CREAT | O_EXCL.
+        
+        An empty placeholder is created, so checking and taking the name is
+        one syscall with no race against other writers; the move replaces
+        it. The next counter for each name is remembered for the run, so a
+        name that keeps coming back needs one probe instead of one per
+        existing copy.
+        
+        Args:
+            dest_dir: Destination folder, ending in a path separator
+            filename: Preferred file name
+            
+        Returns:
+            The claimed path (filename, or name_N.ext on conflict)
+        """
+        base_name, ext = os.path.splitext(filename)
+        key = (dest_dir, base_name, ext)
+        counter = self._dest_counters.get(key)
+        
+        while True:
+            if counter is None:
+                destination = f"{dest_dir}{filename}"
+            else:
+                destination = f"{dest_dir}{base_name}_{counter}{ext}"
+            try:
+                os.close(os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                if counter is not None:
+                    self._dest_counters[key] = counter + 1
+                return destination
+            except FileExistsError:
+                counter = 1 if counter is None else counter + 1
+    
+    def _scan_folders(self):
+        """Index the visible subfolders of the target folder, once per organize run."""
+        self._folder_index = {}  # lowercase name -> actual name, in directory order
+        self._folder_names = set()
+        with os.scandir(self.downloads_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                    self._folder_index.setdefault(entry.name.lower(), entry.name)
+                    self._folder_names.add(entry.name)
+    
     def _get_or_create_folder(self, folder_name: str) -> str:
         """Get existing folder or create new one if needed."""
         folder_path = os.path.join(self.downloads_path, folder_name)
         
-        # Check if exact folder exists
-        if os.path.exists(folder_path):
+        # Check if exact folder exists (the stat only runs for names the
+        # index doesn't know, e.g. a plain file with that name)
+        if folder_name in self._folder_names or os.path.exists(folder_path):
             return folder_path
         
         # Check for similar existing folders (case-insensitive)
-        existing_folders = [item for item in os.listdir(self.downloads_path) 
-                           if os.path.isdir(os.path.join(self.downloads_path, item)) 
-                           and not item.startswith('.')]
-        
-        for existing_folder in existing_folders:
-            if existing_folder.lower() == folder_name.lower():
-                existing_path = os.path.join(self.downloads_path, existing_folder)
-                print(f"📁 Using existing folder: {existing_folder}")
-                return existing_path
+        folder_name_lower = folder_name.lower()
+        existing_folder = self._folder_index.get(folder_name_lower)
+        if existing_folder is not None:
+            existing_path = os.path.join(self.downloads_path, existing_folder)
+            print(f"📁 Using existing folder: {existing_folder}")
+            return existing_path
         
         # Check for partial matches (e.g., "Education" vs "Education and Finance")
-        folder_name_lower = folder_name.lower()
-        for existing_folder in existing_folders:
-            existing_lower = existing_folder.lower()
-            
+        for existing_lower, existing_folder in self._folder_index.items():
             # If new folder name contains existing folder name or vice versa
             if (folder_name_lower in existing_lower or existing_lower in folder_name_lower):
                 existing_path = os.path.join(self.downloads_path, existing_folder)
@@ -314,6 +443,10 @@ class SimpleFileOrganizerGUI:
         try:
             os.makedirs(folder_path, exist_ok=True)
             print(f"📁 Created new folder: {folder_name}")
+            
+            # Keep the index in sync for the rest of the run
+            self._folder_index[folder_name_lower] = folder_name
+            self._folder_names.add(folder_name)
             return folder_path
         except Exception as e:
             print(f"❌ Failed to create folder {folder_name}: {e}")
@@ -6,14 +6,145 @@ AI-powered file organization with beautiful, modern interface
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import errno
 import os
 import sys
+import queue
 import threading
+import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from random_forest_classifier import RandomForestFileClassifier
+from random_forest_classifier import RandomForestFileClassifier, COMPILED_MODEL_SUFFIX
+
+# Model file: bundled next to the executable when frozen, else the working dir
+if getattr(sys, 'frozen', False):
+    MODEL_PATH = os.path.join(sys._MEIPASS, 'rf_file_classifier.joblib')
+else:
+    MODEL_PATH = 'rf_file_classifier.joblib'
+
+# Buffer for cross-filesystem copies; large media files copy much faster
+# with 1 MiB reads than with shutil's 64 KiB default
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Coarsest directory mtime resolution to expect (FAT/exFAT, many SMB
+# servers); a cached listing is only trusted once its mtime is this old
+MTIME_GRANULARITY_NS = 2_000_000_000
+
+
+def _sendfile_copy(fsrc, fdst):
+    """Copy between open files inside the kernel with os.sendfile."""
+    size = os.fstat(fsrc.fileno()).st_size
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, min(size - offset, 1 << 30))
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _copy_file(src, dst):
+    """Copy file contents and metadata from src to dst."""
+    try:
+        if sys.platform == 'win32':
+            # CopyFileW copies data and attributes without leaving the kernel
+            import ctypes
+            if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+                raise ctypes.WinError()
+            return
+        
+        if sys.platform == 'darwin':
+            # shutil.copyfile uses fcopyfile() on macOS
+            shutil.copyfile(src, dst)
+        else:
+            with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+                try:
+                    # Zero-copy on Linux: bytes never pass through Python
+                    _sendfile_copy(fsrc, fdst)
+                except (AttributeError, OSError):
+                    # No sendfile, or unsupported for this filesystem
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+                    shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        shutil.copystat(src, dst)
+    except BaseException:
+        # Don't leave a truncated copy behind
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
+
+
+def _move_file(src, dst):
+    """
+    Move a file, renaming when possible and copying across filesystems.
+    
+    Covers the only case the organizer needs (a regular file to a new
+    name) without shutil.move's generic directory and symlink handling.
+    
+    Args:
+        src: Path of the file to move
+        dst: Destination file path
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        # Only a cross-device rename is worth retrying as a copy; anything
+        # else (missing source, permissions) would fail the copy too
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_file(src, dst)
+        os.unlink(src)
+
+
+def _claim_destination(folder, filename, taken, lock):
+    """
+    Reserve a free file name in folder.
+    
+    Conflicts are resolved against taken, an in-memory set of the names
+    in the folder, so a name that already has many numbered copies costs
+    no extra syscalls. The chosen name is then claimed on disk with
+    O_CREAT | O_EXCL, which also catches files created by other programs
+    since the set was filled; the move replaces the empty placeholder.
+    
+    Args:
+        folder: Destination folder
+        filename: Preferred file name
+        taken: Names already used in folder; updated with the claimed name
+        lock: Lock guarding taken across workers
+        
+    Returns:
+        The claimed path (filename, or name_N.ext on conflict)
+    """
+    base_name, ext = os.path.splitext(filename)
+    candidate = filename
+    counter = 1
+    while True:
+        with lock:
+            while candidate in taken:
+                candidate = f"{base_name}_{counter}{ext}"
+                counter += 1
+            taken.add(candidate)
+        
+        destination = os.path.join(folder, candidate)
+        try:
+            os.close(os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            return destination
+        except FileExistsError:
+            # Appeared on disk after the folder was listed; it is in
+            # taken now, so the next round picks another name
+            continue
+
 
 class ModernFileOrganizerGUI:
+    # Minimum seconds between "Processing" status updates (~10 Hz)
+    STATUS_INTERVAL = 0.1
+    
+    # Files classified per predict_batch call before their moves are queued
+    CLASSIFY_CHUNK = 256
+    
     def __init__(self, root):
         self.root = root
         self.root.title("⚡ AI File Organizer Pro")
@@ -44,6 +175,13 @@ class ModernFileOrganizerGUI:
         # Initialize classifier
         self.classifier = None
         self.animation_running = False
+        self._cached_files = None  # (folder, mtime_ns, files) from _list_files()
+        self._names_lock = threading.Lock()
+        
+        # One persistent worker thread instead of a new thread per organize
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        self._last_status_ts = 0.0
         self.load_classifier()
         
         # Default to Downloads folder
@@ -87,18 +225,17 @@ class ModernFileOrganizerGUI:
         try:
             self.classifier = RandomForestFileClassifier()
             
-            # Get the correct path for the model file
-            if getattr(sys, 'frozen', False):
-                # Running as executable
-                bundle_dir = sys._MEIPASS
-                model_path = os.path.join(bundle_dir, 'rf_file_classifier.joblib')
-            else:
-                # Running as script
-                model_path = 'rf_file_classifier.joblib'
+            model_path = MODEL_PATH
             
             if os.path.exists(model_path):
                 self.classifier.load_model(model_path)
                 print("✅ Classifier loaded successfully")
+                
+                # Prefer a natively compiled (or ONNX) export of the forest
+                # shipped next to the joblib model
+                stem = os.path.splitext(model_path)[0]
+                if not self.classifier.load_compiled(stem + COMPILED_MODEL_SUFFIX):
+                    self.classifier.load_onnx(stem + '.onnx')
             else:
                 messagebox.showerror("Error", f"Model file not found at: {model_path}")
         except Exception as e:
@@ -433,13 +570,43 @@ class ModernFileOrganizerGUI:
         
         self.files_count_label.config(fg=color)
     
+    def _list_files(self):
+        """
+        List the files directly inside the selected folder.
+        
+        The listing is cached together with the folder's mtime, so the
+        count shown after browsing is reused by the next organize run
+        as long as no entry has been added, removed or renamed. A folder
+        changed within the last MTIME_GRANULARITY_NS is not cached: on
+        coarse-timestamp filesystems a second change in the same tick
+        would leave the mtime as it was.
+        
+        Returns:
+            List of (name, path) tuples
+        """
+        folder = self.downloads_path
+        mtime = os.stat(folder).st_mtime_ns
+        
+        cached = self._cached_files
+        if cached and cached[0] == folder and cached[1] == mtime:
+            return cached[2]
+        
+        # DirEntry carries the file type, so no extra stat per entry; not
+        # following symlinks keeps that true for links as well
+        with os.scandir(folder) as entries:
+            files = [(entry.name, entry.path) for entry in entries
+                     if entry.is_file(follow_symlinks=False)]
+        
+        if time.time_ns() - mtime >= MTIME_GRANULARITY_NS:
+            self._cached_files = (folder, mtime, files)
+        else:
+            self._cached_files = None
+        return files
+    
     def count_files(self):
         """Count files in the selected folder."""
         try:
-            if os.path.exists(self.downloads_path):
-                files = [f for f in os.listdir(self.downloads_path) 
-                        if os.path.isfile(os.path.join(self.downloads_path, f))]
-                return len(files)
+            return len(self._list_files())
         except:
             pass
         return 0
@@ -461,22 +628,22 @@ class ModernFileOrganizerGUI:
             bg=self.colors['text_muted']
         )
         self.progress.start(10)
-        self.status_label.config(text="🔍 Scanning files...", fg=self.colors['accent_blue'])
+        self._set_status("🔍 Scanning files...", self.colors['accent_blue'])
         
-        # Run organization in separate thread
-        thread = threading.Thread(target=self._organize_worker)
-        thread.daemon = True
-        thread.start()
+        # Run organization on the background worker thread
+        self._jobs.put(self._organize_worker)
+    
+    def _worker_loop(self):
+        """Run queued jobs on one long-lived background thread."""
+        while True:
+            job = self._jobs.get()
+            job()
     
     def _organize_worker(self):
         """Worker thread for file organization."""
         try:
             # Get all files in the folder
-            files = []
-            for item in os.listdir(self.downloads_path):
-                item_path = os.path.join(self.downloads_path, item)
-                if os.path.isfile(item_path):
-                    files.append(item_path)
+            files = self._list_files()
             
             if not files:
                 self.root.after(0, lambda: self._show_completion("No files to organize!", 'info'))
@@ -486,43 +653,48 @@ class ModernFileOrganizerGUI:
             organized_count = 0
             categories = set()
             
-            for i, file_path in enumerate(files):
-                try:
-                    # Update status
-                    filename = os.path.basename(file_path)
-                    display_name = filename[:25] + "..." if len(filename) > 25 else filename
-                    self.root.after(0, lambda name=display_name: 
-                                   self.status_label.config(
-                                       text=f"🤖 Processing: {name}",
-                                       fg=self.colors['accent_purple']
-                                   ))
-                    
-                    # Classify file
-                    result = self.classifier.predict(file_path)
-                    category = result['folder_name']  # Use folder_name instead of predicted_category
-                    categories.add(category)
-                    
-                    # Create category folder if it doesn't exist
-                    category_folder = os.path.join(self.downloads_path, category)
-                    os.makedirs(category_folder, exist_ok=True)
+            # Pipeline: this thread classifies the files in chunks and hands
+            # each chunk to a pool of movers, so moving the first files
+            # overlaps classifying the rest. Moves release the GIL.
+            category_folders = {}  # category -> (folder path, names already in it)
+            futures = []
+            max_workers = min(8, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for start in range(0, len(files), self.CLASSIFY_CHUNK):
+                    chunk = files[start:start + self.CLASSIFY_CHUNK]
                     
-                    # Move file to category folder
-                    destination = os.path.join(category_folder, os.path.basename(file_path))
+                    # Unambiguous extensions skip the classifier; the rest of
+                    # the chunk goes through one forest evaluation
+                    results = [self.classifier.predict_from_extension(path) for _, path in chunk]
+                    pending = [i for i, result in enumerate(results) if result is None]
+                    if pending:
+                        batch_results = self.classifier.predict_batch([chunk[i][1] for i in pending])
+                        for i, result in zip(pending, batch_results):
+                            results[i] = result
                     
-                    # Handle name conflicts
-                    counter = 1
-                    base_name, ext = os.path.splitext(os.path.basename(file_path))
-                    while os.path.exists(destination):
-                        new_name = f"{base_name}_{counter}{ext}"
-                        destination = os.path.join(category_folder, new_name)
-                        counter += 1
+                    # Create each category folder once, not once per file, and
+                    # list its current names so conflicts resolve in memory
+                    for result in results:
+                        category = result.get('folder_name')
+                        if category and category not in category_folders:
+                            category_folder = os.path.join(self.downloads_path, category)
+                            try:
+                                os.makedirs(category_folder, exist_ok=True)
+                                category_folders[category] = (category_folder, set(os.listdir(category_folder)))
+                            except OSError as e:
+                                # Its files will fail (and be reported) individually
+                                category_folders[category] = (category_folder, set())
+                                print(f"Error creating folder {category}: {e}")
                     
-                    shutil.move(file_path, destination)
-                    organized_count += 1
-                    
-                except Exception as e:
-                    print(f"Error organizing {file_path}: {e}")
-                    continue
+                    futures.extend(executor.submit(self._process_one, filename, file_path, result, category_folders)
+                                   for (filename, file_path), result in zip(chunk, results))
+                
+                for (_, file_path), future in zip(files, futures):
+                    try:
+                        categories.add(future.result())
+                        organized_count += 1
+                    except Exception as e:
+                        print(f"Error organizing {file_path}: {e}")
             
             # Show completion message
             message = f"🎉 Successfully organized {organized_count} files into {len(categories)} categories:\n\n"
@@ -533,6 +705,56 @@ class ModernFileOrganizerGUI:
         except Exception as e:
             self.root.after(0, lambda: self._show_completion(f"❌ Error: {e}", 'error'))
     
+    def _process_one(self, filename, file_path, result, category_folders):
+        """
+        Move a classified file into its category folder.
+        
+        Args:
+            filename: Name of the file
+            file_path: Path of the file to organize
+            result: Prediction dictionary for the file
+            category_folders: Category -> (folder path, set of names in it)
+            
+        Returns:
+            Name of the category folder the file was moved to
+        """
+        # Update status at most every STATUS_INTERVAL seconds; per-file
+        # callbacks would flood the Tk event loop on large folders
+        now = time.monotonic()
+        if now - self._last_status_ts >= self.STATUS_INTERVAL:
+            self._last_status_ts = now
+            display_name = filename[:25] + "..." if len(filename) > 25 else filename
+            self.root.after_idle(self._set_status, f"🤖 Processing: {display_name}",
+                                 self.colors['accent_purple'])
+        
+        if 'error' in result:
+            raise RuntimeError(result['error'])
+        category = result['folder_name']  # Use folder_name instead of predicted_category
+        
+        # Category folders were created before the moves started
+        category_folder, taken_names = category_folders[category]
+        
+        # Move file to category folder, handling name conflicts
+        destination = _claim_destination(category_folder, filename,
+                                         taken_names, self._names_lock)
+        try:
+            # Category folders live inside the source folder, so a
+            # plain rename is enough; copy only if that fails
+            _move_file(file_path, destination)
+        except BaseException:
+            # Release the claimed name
+            try:
+                os.unlink(destination)
+            except OSError:
+                pass
+            raise
+        
+        return category
+    
+    def _set_status(self, text, color):
+        """Update the status line text and color."""
+        self.status_label.config(text=text, fg=color)
+    
     def _show_completion(self, message, msg_type='info'):
         """Show completion message and reset UI."""
         self.progress.stop()
@@ -541,7 +763,7 @@ class ModernFileOrganizerGUI:
             text="🚀 Organize Files with AI", 
             bg=self.colors['accent_green']
         )
-        self.status_label.config(text="Ready to organize files", fg=self.colors['text_secondary'])
+        self._set_status("Ready to organize files", self.colors['text_secondary'])
         self.update_file_count()
         
         # Show appropriate message box
@@ -6,9 +6,12 @@ Organizes files in Downloads folder automatically using AI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import errno
 import os
+import queue
 import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from random_forest_classifier import RandomForestFileClassifier
 
@@ -20,9 +23,20 @@ class SimpleFileOrganizerGUI:
         self.root.configure(bg='#f0f0f0')
         self.root.resizable(False, False)  # Fixed size for simplicity
         
-        # Initialize classifier
+        # Initialize classifier; the model is deserialized on the worker
+        # thread so the window shows up right away
         self.classifier = None
-        self.load_classifier()
+        self._classifier_error = None
+        self._classifier_ready = threading.Event()
+        self._existing_dirs = set()  # Subfolder names, filled per organize run
+        self._folder_names = {}  # Category folder -> names in it, listed lazily
+        self._current_file = None  # Set by the worker, shown by _tick()
+        self._progress_counter = 0  # Files handled so far
+        self._progress_total = None  # Files to handle, once scanned
+        self._organizing = False
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        self._jobs.put(self.load_classifier)
         
         # Default to Downloads folder
         self.downloads_path = str(Path.home() / "Downloads")
@@ -30,17 +44,42 @@ class SimpleFileOrganizerGUI:
         # Create GUI
         self.create_widgets()
         
+        # Keep the organize button disabled until the model is in
+        self.organize_btn.config(state='disabled', text="Loading model...", bg='#95a5a6')
+        self.status_label.config(text="Loading classifier...", fg='#3498db')
+        self._check_classifier()
+        
     def load_classifier(self):
-        """Load the trained Random Forest classifier."""
+        """
+        Load the trained Random Forest classifier.
+        
+        Runs as the first job on the worker thread: it only sets
+        attributes, and _check_classifier reports the outcome from the
+        main loop.
+        """
         try:
-            self.classifier = RandomForestFileClassifier()
+            classifier = RandomForestFileClassifier()
             if os.path.exists('rf_file_classifier.joblib'):
-                self.classifier.load_model('rf_file_classifier.joblib')
+                classifier.load_model('rf_file_classifier.joblib')
+                self.classifier = classifier
                 print("✅ Classifier loaded successfully")
             else:
-                messagebox.showerror("Error", "Model file not found. Please train the model first.")
+                self._classifier_error = "Model file not found. Please train the model first."
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load classifier: {e}")
+            self._classifier_error = f"Failed to load classifier: {e}"
+        finally:
+            self._classifier_ready.set()
+    
+    def _check_classifier(self):
+        """Poll the background model load and enable organizing when done."""
+        if not self._classifier_ready.is_set():
+            self.root.after(100, self._check_classifier)
+            return
+        
+        self.organize_btn.config(state='normal', text="🚀 Organize Files", bg='#27ae60')
+        self.status_label.config(text="Ready to organize files", fg='#7f8c8d')
+        if self._classifier_error:
+            messagebox.showerror("Error", self._classifier_error)
     
     def create_widgets(self):
         """Create simple GUI widgets."""
@@ -171,13 +210,12 @@ class SimpleFileOrganizerGUI:
     def count_files(self):
         """Count files in the selected folder."""
         try:
-            if os.path.exists(self.downloads_path):
-                files = [f for f in os.listdir(self.downloads_path) 
-                        if os.path.isfile(os.path.join(self.downloads_path, f))]
-                return len(files)
-        except:
-            pass
-        return 0
+            # DirEntry knows its type, so no stat per entry; a missing or
+            # unreadable folder raises here, no separate exists() probe
+            with os.scandir(self.downloads_path) as entries:
+                return sum(1 for entry in entries if entry.is_file(follow_symlinks=False))
+        except OSError:
+            return 0
     
     def organize_files(self):
         """Organize files in the selected folder."""
@@ -185,88 +223,241 @@ class SimpleFileOrganizerGUI:
             messagebox.showerror("Error", "Classifier not loaded!")
             return
         
-        if not os.path.exists(self.downloads_path):
-            messagebox.showerror("Error", "Selected folder does not exist!")
-            return
-        
         # Disable button and start progress
         self.organize_btn.config(state='disabled', text="Organizing...", bg='#95a5a6')
         self.progress.start(10)
         self.status_label.config(text="Scanning files...", fg='#3498db')
         
-        # Run organization in separate thread
-        thread = threading.Thread(target=self._organize_worker)
-        thread.daemon = True
-        thread.start()
+        # Run organization on the background worker thread; the status
+        # label polls its progress instead of getting a callback per file
+        self._current_file = None
+        self._progress_counter = 0
+        self._progress_total = None
+        self._organizing = True
+        self._jobs.put(self._organize_worker)
+        self.root.after(100, self._tick)
+    
+    def _worker_loop(self):
+        """Run queued jobs on one long-lived background thread."""
+        while True:
+            job = self._jobs.get()
+            job()
+    
+    def _tick(self):
+        """Show the worker's progress, about ten times a second."""
+        if not self._organizing:
+            return
+        
+        total = self._progress_total
+        if total:
+            # Scan finished: swap the busy animation for real progress
+            if str(self.progress.cget('mode')) != 'determinate':
+                self.progress.stop()
+                self.progress.config(mode='determinate', maximum=total)
+            self.progress.config(value=self._progress_counter)
+        
+        if self._current_file is not None:
+            self.status_label.config(text=f"Processing: {self._current_file[:30]}...")
+        self.root.after(100, self._tick)
     
     def _organize_worker(self):
         """Worker thread for file organization."""
         try:
             # Get all files in the folder
-            files = []
-            for item in os.listdir(self.downloads_path):
-                item_path = os.path.join(self.downloads_path, item)
-                if os.path.isfile(item_path):
-                    files.append(item_path)
+            # A missing folder is reported by scandir itself
+            try:
+                with os.scandir(self.downloads_path) as entries:
+                    files = [(entry.path, entry.name) for entry in entries
+                             if entry.is_file(follow_symlinks=False)]
+            except FileNotFoundError:
+                self.root.after(0, lambda: self._show_completion("Selected folder does not exist!", 'error'))
+                return
             
             if not files:
                 self.root.after(0, lambda: self._show_completion("No files to organize!"))
                 return
             
+            # Index existing subfolders once instead of probing per file
+            self._scan_folders()
+            self._folder_names = {}
+            
+            # Separator-terminated once; folder names are appended to it
+            root_prefix = os.path.join(self.downloads_path, '')
+            
             # Create organized folders
             organized_count = 0
-            categories = set()
+            categories = {}  # category -> files moved, in first-seen order
             
-            for i, file_path in enumerate(files):
+            # Phase 1: classify all files with one forest evaluation; features
+            # are gathered on a few threads so slow stats (network drives) overlap
+            results = self.classifier.predict_batch(
+                [file_path for file_path, _ in files],
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            )
+            
+            # Phase 2: plan every move - create the folders before any file
+            # is touched. Each missing category folder is created once, up
+            # front; a failure is kept and reported for every file of that
+            # category. Names are claimed by the movers, right before each
+            # rename, so an interrupted run leaves no empty placeholders.
+            folder_errors = {}
+            for category in dict.fromkeys(result['predicted_category'] for result in results
+                                          if 'error' not in result):
+                category_folder = root_prefix + category
                 try:
-                    # Update status
-                    self.root.after(0, lambda f=os.path.basename(file_path): 
-                                   self.status_label.config(text=f"Processing: {f[:30]}..."))
-                    
-                    # Classify file
-                    result = self.classifier.predict(file_path)
+                    if category not in self._existing_dirs:
+                        os.makedirs(category_folder, exist_ok=True)
+                        self._existing_dirs.add(category)
+                    # Listed here once, not lazily by the concurrent movers
+                    self._folder_names[category_folder] = set(os.listdir(category_folder))
+                except OSError as e:
+                    folder_errors[category] = e
+            
+            moves = []
+            for (file_path, filename), result in zip(files, results):
+                try:
+                    if 'error' in result:
+                        raise RuntimeError(result['error'])
                     category = result['predicted_category']
-                    categories.add(category)
-                    
-                    # Create category folder if it doesn't exist
-                    category_folder = os.path.join(self.downloads_path, category)
-                    os.makedirs(category_folder, exist_ok=True)
+                    categories.setdefault(category, 0)
                     
-                    # Move file to category folder
-                    destination = os.path.join(category_folder, os.path.basename(file_path))
+                    if category in folder_errors:
+                        raise folder_errors[category]
                     
-                    # Handle name conflicts
-                    counter = 1
-                    base_name, ext = os.path.splitext(os.path.basename(file_path))
-                    while os.path.exists(destination):
-                        new_name = f"{base_name}_{counter}{ext}"
-                        destination = os.path.join(category_folder, new_name)
-                        counter += 1
-                    
-                    shutil.move(file_path, destination)
-                    organized_count += 1
+                    moves.append((file_path, filename, root_prefix + category, category))
                     
                 except Exception as e:
                     print(f"Error organizing {file_path}: {e}")
                     continue
             
+            # Phase 3: claims and renames release the GIL, so a few movers
+            # keep slow (network) filesystems busy
+            self._progress_total = len(moves)
+            max_workers = min(8, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._place_file, file_path, filename, category_folder): (file_path, filename, category)
+                           for file_path, filename, category_folder, category in moves}
+                for i, future in enumerate(as_completed(futures), 1):
+                    file_path, filename, category = futures[future]
+                    
+                    # Picked up by _tick() on the Tk thread
+                    self._current_file = filename
+                    self._progress_counter = i
+                    try:
+                        future.result()
+                        organized_count += 1
+                        categories[category] += 1
+                    except Exception as e:
+                        print(f"Error organizing {file_path}: {e}")
+            
             # Show completion message
             message = f"✅ Successfully organized {organized_count} files into {len(categories)} categories:\n"
-            message += ", ".join(sorted(categories))
+            message += ", ".join(f"{category} ({count})" for category, count in categories.items())
             
             self.root.after(0, lambda: self._show_completion(message))
             
         except Exception as e:
             self.root.after(0, lambda: self._show_completion(f"❌ Error: {e}"))
     
-    def _show_completion(self, message):
-        """Show completion message and reset UI."""
+    def _place_file(self, file_path: str, filename: str, category_folder: str):
+        """
+        Claim a free name in a category folder and move the file onto it.
+        
+        Args:
+            file_path: Path of the file to move
+            filename: Name of the file
+            category_folder: Destination folder
+        """
+        self._move_file(file_path, self._claim_destination(category_folder, filename))
+    
+    def _move_file(self, file_path: str, destination: str):
+        """
+        Move a file onto its claimed destination.
+        
+        Args:
+            file_path: Path of the file to move
+            destination: Path returned by _claim_destination()
+        """
+        # Same filesystem in practice: a single rename syscall that
+        # replaces the claimed placeholder
+        try:
+            try:
+                os.replace(file_path, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(file_path, destination)
+        except Exception:
+            # Release the claimed name
+            try:
+                os.unlink(destination)
+            except OSError:
+                pass
+            raise
+    
+    def _scan_folders(self):
+        """Collect the names of the subfolders in the target folder."""
+        with os.scandir(self.downloads_path) as entries:
+            self._existing_dirs = {entry.name for entry in entries
+                                   if entry.is_dir(follow_symlinks=False)}
+    
+    def _claim_destination(self, category_folder: str, filename: str) -> str:
+        """
+        Reserve a free file name in a category folder.
+        
+        Conflicts are resolved against the folder's names, listed once per
+        run, so numbered copies cost no stat each. The chosen name is then
+        claimed with O_CREAT | O_EXCL, which also catches files created by
+        other programs since the listing; the move replaces the empty
+        placeholder.
+        
+        Args:
+            category_folder: Destination folder
+            filename: Preferred file name
+            
+        Returns:
+            The claimed path (filename, or name_N.ext on conflict)
+        """
+        taken = self._folder_names.get(category_folder)
+        if taken is None:
+            taken = self._folder_names[category_folder] = set(os.listdir(category_folder))
+        
+        base_name, ext = os.path.splitext(filename)
+        candidate = filename
+        counter = 1
+        while True:
+            while candidate in taken:
+                candidate = f"{base_name}_{counter}{ext}"
+                counter += 1
+            taken.add(candidate)
+            
+            destination = f"{category_folder}{os.sep}{candidate}"
+            try:
+                os.close(os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                return destination
+            except FileExistsError:
+                # Appeared after the listing; it is in taken now
+                continue
+    
+    def _show_completion(self, message, msg_type='info'):
+        """
+        Show completion message and reset UI.
+        
+        Args:
+            message: Text for the dialog
+            msg_type: 'error' shows an error dialog instead of the summary
+        """
+        self._organizing = False
         self.progress.stop()
+        self.progress.config(mode='indeterminate', value=0)
         self.organize_btn.config(state='normal', text="🚀 Organize Files", bg='#27ae60')
         self.status_label.config(text="Ready to organize files", fg='#7f8c8d')
         self.stats_label.config(text=f"📊 Files in folder: {self.count_files()}")
         
-        messagebox.showinfo("Organization Complete", message)
+        if msg_type == 'error':
+            messagebox.showerror("Error", message)
+        else:
+            messagebox.showinfo("Organization Complete", message)
 
 
 def main():
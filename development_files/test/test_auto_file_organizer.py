@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Auto Organizer Tests - target claiming, failed moves and download settling
+"""
+
+import io
+import logging
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+DEV_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(DEV_DIR))
+sys.path.insert(0, DEV_DIR)
+
+from auto_file_organizer import FileOrganizerHandler
+
+
+def make_handler(downloads_path):
+    """Build a handler without starting its worker threads."""
+    handler = FileOrganizerHandler.__new__(FileOrganizerHandler)
+    handler.downloads_path = Path(downloads_path)
+    handler.existing_folders = set()
+    handler._folder_by_lower = {}
+    handler._next_counter = {}
+    handler.logger = logging.getLogger('test_auto_file_organizer')
+    handler._stats_lock = threading.Lock()
+    handler._stats_fh = io.StringIO()
+    handler._event_queue = queue.Queue()
+    handler.stable_poll_interval = 0.05
+    handler.max_settle_seconds = 1.0
+    return handler
+
+
+class HandlerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.folder = Path(self.tmp)
+        self.handler = make_handler(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, data=b'data'):
+        path = self.folder / name
+        path.write_bytes(data)
+        return path
+
+
+class ClaimTargetTest(HandlerTestCase):
+
+    def test_free_name_is_kept(self):
+        target = self.folder / 'a.pdf'
+        self.assertEqual(self.handler._claim_target(target), target)
+        self.assertTrue(target.exists())
+
+    def test_conflicts_continue_after_highest_suffix(self):
+        self.write('a.pdf')
+        self.write('a_1.pdf')
+        self.write('a_7.txt')
+        self.assertEqual(self.handler._claim_target(self.folder / 'a.pdf'), self.folder / 'a_2.pdf')
+        self.assertEqual(self.handler._claim_target(self.folder / 'a.pdf'), self.folder / 'a_3.pdf')
+
+    def test_gaps_below_highest_suffix_are_not_reused(self):
+        self.write('a.pdf')
+        self.write('a_4.pdf')
+        self.assertEqual(self.handler._claim_target(self.folder / 'a.pdf'), self.folder / 'a_5.pdf')
+
+    def test_counter_skips_files_created_meanwhile(self):
+        self.write('a.pdf')
+        self.assertEqual(self.handler._claim_target(self.folder / 'a.pdf'), self.folder / 'a_1.pdf')
+        self.write('a_2.pdf')
+        self.assertEqual(self.handler._claim_target(self.folder / 'a.pdf'), self.folder / 'a_3.pdf')
+
+
+class MoveFileTest(HandlerTestCase):
+
+    def test_move_replaces_placeholder(self):
+        src = self.write('a.pdf', b'payload')
+        self.handler._move_file(src, 'Docs', 0.9)
+        self.assertFalse(src.exists())
+        self.assertEqual((self.folder / 'Docs' / 'a.pdf').read_bytes(), b'payload')
+        self.assertIn(',a.pdf,Docs,0.900', self.handler._stats_fh.getvalue())
+
+    def test_conflicting_move_is_numbered(self):
+        (self.folder / 'Docs').mkdir()
+        (self.folder / 'Docs' / 'a.pdf').write_bytes(b'old')
+        self.handler._move_file(self.write('a.pdf', b'new'), 'Docs', 0.9)
+        self.assertEqual((self.folder / 'Docs' / 'a.pdf').read_bytes(), b'old')
+        self.assertEqual((self.folder / 'Docs' / 'a_1.pdf').read_bytes(), b'new')
+
+    def test_failed_move_releases_claim(self):
+        with self.assertLogs('test_auto_file_organizer', level='ERROR'):
+            self.handler._move_file(self.folder / 'gone.pdf', 'Docs', 0.9)
+        self.assertEqual(os.listdir(self.folder / 'Docs'), [])
+        self.assertEqual(self.handler._stats_fh.getvalue(), '')
+
+
+class SettledFilesTest(HandlerTestCase):
+
+    def test_stable_file_is_settled(self):
+        path = self.write('a.pdf')
+        self.assertEqual(self.handler._settled_files([path]), [path])
+        self.assertTrue(self.handler._event_queue.empty())
+
+    def test_empty_file_is_settled(self):
+        path = self.write('empty.pdf', b'')
+        self.assertEqual(self.handler._settled_files([path]), [path])
+
+    def test_vanished_file_is_dropped(self):
+        path = self.write('a.pdf')
+        missing = self.folder / 'missing.pdf'
+        self.assertEqual(self.handler._settled_files([path, missing]), [path])
+        self.assertTrue(self.handler._event_queue.empty())
+
+    def test_growing_file_is_requeued(self):
+        stable = self.write('done.pdf')
+        growing = self.write('part.pdf', b'')
+        stop = threading.Event()
+
+        def keep_writing():
+            with open(growing, 'ab') as f:
+                while not stop.is_set():
+                    f.write(b'x' * 1024)
+                    f.flush()
+                    time.sleep(0.005)
+
+        writer = threading.Thread(target=keep_writing)
+        writer.start()
+        try:
+            time.sleep(0.02)
+            self.assertEqual(self.handler._settled_files([stable, growing]), [stable])
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(self.handler._event_queue.get_nowait(), growing)
+        self.assertTrue(self.handler._event_queue.empty())
+
+    def test_gives_up_after_max_settle_seconds(self):
+        growing = self.write('part.pdf', b'')
+        self.handler.max_settle_seconds = 0.2
+        stop = threading.Event()
+
+        def keep_writing():
+            with open(growing, 'ab') as f:
+                while not stop.is_set():
+                    f.write(b'x')
+                    f.flush()
+                    time.sleep(0.005)
+
+        writer = threading.Thread(target=keep_writing)
+        writer.start()
+        try:
+            started = time.monotonic()
+            self.assertEqual(self.handler._settled_files([growing]), [])
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(self.handler._event_queue.get_nowait(), growing)
+
+
+if __name__ == '__main__':
+    unittest.main()
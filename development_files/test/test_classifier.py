@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Classifier Tests - predict_batch, the prediction cache and the extension table
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+from random_forest_classifier import RandomForestFileClassifier, EXTENSION_CATEGORY_LUT
+
+MODEL_PATH = os.path.join(REPO_ROOT, 'rf_file_classifier.joblib')
+TRAIN_CSV = os.path.join(REPO_ROOT, 'train.csv')
+
+
+def create_sample_files(folder, limit=None):
+    """
+    Create empty files named and sized like the rows of train.csv.
+
+    Args:
+        folder: Folder to create the files in
+        limit: Maximum number of files, or None for every row
+
+    Returns:
+        List of created file paths
+    """
+    paths = []
+    with open(TRAIN_CSV, newline='') as f:
+        for row in csv.DictReader(f):
+            path = os.path.join(folder, row['filename'])
+            if path in paths:
+                continue
+            with open(path, 'wb') as fh:
+                fh.truncate(int(row['size_bytes']))
+            paths.append(path)
+            if limit is not None and len(paths) >= limit:
+                break
+    return paths
+
+
+class PredictBatchTest(unittest.TestCase):
+    """predict_batch() must agree with predict() file by file."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp()
+        cls.paths = create_sample_files(cls.tmp, limit=200)
+        cls.classifier = RandomForestFileClassifier()
+        cls.classifier.load_model(MODEL_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp)
+
+    def setUp(self):
+        self.classifier.clear_prediction_cache()
+
+    def assertSamePredictions(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for e, a in zip(expected, actual):
+            self.assertEqual(e['filename'], a['filename'])
+            self.assertEqual(e['predicted_category'], a['predicted_category'])
+            self.assertEqual(e['folder_name'], a['folder_name'])
+            self.assertAlmostEqual(e['confidence'], a['confidence'], places=9)
+
+    def test_batch_matches_single(self):
+        single = [self.classifier.predict(p) for p in self.paths]
+        batch = self.classifier.predict_batch(self.paths)
+        self.assertSamePredictions(single, batch)
+
+    def test_batch_threaded_extraction(self):
+        single = [self.classifier.predict(p) for p in self.paths]
+        batch = self.classifier.predict_batch(self.paths, max_workers=4)
+        self.assertSamePredictions(single, batch)
+
+    def test_cached_batch_matches_uncached(self):
+        uncached = self.classifier.predict_batch(self.paths)
+        first = self.classifier.predict_batch(self.paths, use_cache=True)
+        second = self.classifier.predict_batch(self.paths, use_cache=True)
+        self.assertSamePredictions(uncached, first)
+        self.assertSamePredictions(uncached, second)
+
+    def test_cached_single_matches_uncached(self):
+        for path in self.paths[:50]:
+            expected = self.classifier.predict(path)
+            self.assertSamePredictions([expected], [self.classifier.predict(path, use_cache=True)])
+            self.assertSamePredictions([expected], [self.classifier.predict(path, use_cache=True)])
+
+    def test_cache_relabels_filename(self):
+        # Same name, different folder: identical features, one cache entry
+        other = tempfile.mkdtemp()
+        try:
+            copy = shutil.copy(self.paths[0], os.path.join(other, os.path.basename(self.paths[0])))
+            first = self.classifier.predict(self.paths[0], use_cache=True)
+            second = self.classifier.predict(copy, use_cache=True)
+            self.assertEqual(first['predicted_category'], second['predicted_category'])
+            self.assertEqual(second['filename'], os.path.basename(copy))
+        finally:
+            shutil.rmtree(other)
+
+    def test_batch_error_marks_every_file(self):
+        untrained = RandomForestFileClassifier()
+        results = untrained.predict_batch(self.paths[:3])
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIn('error', result)
+            self.assertEqual(result['confidence'], 0.0)
+
+
+class ExtensionLookupTest(unittest.TestCase):
+    """predict_from_extension() must only answer for unambiguous extensions."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = RandomForestFileClassifier()
+        cls.classifier.load_model(MODEL_PATH)
+
+    def test_unlisted_extension_falls_through(self):
+        self.assertIsNone(self.classifier.predict_from_extension('report.pdf'))
+        self.assertIsNone(self.classifier.predict_from_extension('no_extension'))
+
+    def test_extension_is_case_insensitive(self):
+        result = self.classifier.predict_from_extension('MOVIE.AVI')
+        self.assertEqual(result['predicted_category'], EXTENSION_CATEGORY_LUT['.avi'])
+        self.assertEqual(result['filename'], 'MOVIE.AVI')
+
+    def test_lookup_agrees_with_training_labels(self):
+        # Each listed extension must be near-unanimous in the training data
+        labels = {}
+        with open(TRAIN_CSV, newline='') as f:
+            for row in csv.DictReader(f):
+                ext = os.path.splitext(row['filename'])[1].lower()
+                labels.setdefault(ext, []).append(row['label'])
+
+        for ext, category in EXTENSION_CATEGORY_LUT.items():
+            seen = labels.get(ext, [])
+            self.assertGreaterEqual(len(seen), 10, ext)
+            self.assertGreater(seen.count(category) / len(seen), 0.98, ext)
+            self.assertEqual(self.classifier.predict_from_extension('x' + ext)['predicted_category'],
+                             category)
+
+
+if __name__ == '__main__':
+    unittest.main()
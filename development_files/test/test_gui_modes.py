@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+GUI Organizer Tests - name claiming, failed moves and folder listing, without a window
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TEST_DIR)
+sys.path.insert(0, os.path.dirname(TEST_DIR))
+
+from test_classifier import MODEL_PATH, create_sample_files
+from random_forest_classifier import RandomForestFileClassifier
+import file_classifier_gui
+import file_classifier_gui_new
+import file_classifier_gui_modern
+import file_classifier_gui_watchdog
+
+
+def touch(path):
+    """Create an empty file."""
+    open(path, 'w').close()
+
+
+class FolderTestCase(unittest.TestCase):
+    """Give every test a scratch folder."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def assertFolderHolds(self, *names):
+        self.assertEqual(sorted(os.listdir(self.tmp)), sorted(names))
+
+
+class ModernClaimTest(FolderTestCase):
+
+    def claim(self, filename, taken):
+        return file_classifier_gui_modern._claim_destination(self.tmp, filename, taken,
+                                                             threading.Lock())
+
+    def test_free_name_is_kept(self):
+        self.assertEqual(self.claim('a.pdf', set()), os.path.join(self.tmp, 'a.pdf'))
+        self.assertFolderHolds('a.pdf')
+
+    def test_conflicts_are_numbered(self):
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        touch(os.path.join(self.tmp, 'a_1.pdf'))
+        taken = set(os.listdir(self.tmp))
+        self.assertEqual(self.claim('a.pdf', taken), os.path.join(self.tmp, 'a_2.pdf'))
+        self.assertEqual(self.claim('a.pdf', taken), os.path.join(self.tmp, 'a_3.pdf'))
+        self.assertFolderHolds('a.pdf', 'a_1.pdf', 'a_2.pdf', 'a_3.pdf')
+
+    def test_file_created_after_listing(self):
+        taken = set(os.listdir(self.tmp))
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        self.assertEqual(self.claim('a.pdf', taken), os.path.join(self.tmp, 'a_1.pdf'))
+
+    def test_failed_move_releases_claim(self):
+        gui = file_classifier_gui_modern.ModernFileOrganizerGUI.__new__(
+            file_classifier_gui_modern.ModernFileOrganizerGUI)
+        gui.root = mock.Mock()
+        gui.colors = mock.MagicMock()
+        gui._last_status_ts = 0.0
+        gui._names_lock = threading.Lock()
+
+        category_folders = {'Docs': (self.tmp, set())}
+        result = {'folder_name': 'Docs'}
+        missing = os.path.join(self.tmp, 'gone', 'a.pdf')
+        with self.assertRaises(FileNotFoundError):
+            gui._process_one('a.pdf', missing, result, category_folders)
+        self.assertFolderHolds()
+
+
+class ModernListFilesTest(FolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.gui = file_classifier_gui_modern.ModernFileOrganizerGUI.__new__(
+            file_classifier_gui_modern.ModernFileOrganizerGUI)
+        self.gui.downloads_path = self.tmp
+        self.gui._cached_files = None
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        os.mkdir(os.path.join(self.tmp, 'Docs'))
+
+    def set_folder_mtime(self, age_ns):
+        mtime = time.time_ns() - age_ns
+        os.utime(self.tmp, ns=(mtime, mtime))
+
+    def test_lists_files_only(self):
+        self.assertEqual(self.gui._list_files(), [('a.pdf', os.path.join(self.tmp, 'a.pdf'))])
+
+    def test_unchanged_folder_reuses_listing(self):
+        self.set_folder_mtime(60 * 10**9)
+        first = self.gui._list_files()
+        with mock.patch.object(file_classifier_gui_modern.os, 'scandir') as scandir:
+            self.assertIs(self.gui._list_files(), first)
+            scandir.assert_not_called()
+
+    def test_changed_mtime_rescans(self):
+        self.set_folder_mtime(60 * 10**9)
+        self.gui._list_files()
+        touch(os.path.join(self.tmp, 'b.pdf'))
+        self.set_folder_mtime(30 * 10**9)
+        self.assertEqual(sorted(name for name, _ in self.gui._list_files()), ['a.pdf', 'b.pdf'])
+
+    def test_recent_change_is_not_cached(self):
+        # Within the timestamp granularity a second change could keep the mtime
+        self.set_folder_mtime(0)
+        self.gui._list_files()
+        self.assertIsNone(self.gui._cached_files)
+
+    def test_other_folder_rescans(self):
+        self.set_folder_mtime(60 * 10**9)
+        self.gui._list_files()
+        other = tempfile.mkdtemp()
+        try:
+            self.gui.downloads_path = other
+            self.assertEqual(self.gui._list_files(), [])
+        finally:
+            shutil.rmtree(other)
+
+
+class SimpleGuiClaimTest(FolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.gui = file_classifier_gui.SimpleFileOrganizerGUI.__new__(
+            file_classifier_gui.SimpleFileOrganizerGUI)
+        self.gui._dest_counters = {}
+
+    def claim(self, filename):
+        return self.gui._claim_destination(self.tmp + os.sep, filename)
+
+    def test_conflicts_are_numbered(self):
+        self.assertEqual(self.claim('a.pdf'), os.path.join(self.tmp, 'a.pdf'))
+        touch(os.path.join(self.tmp, 'a_1.pdf'))
+        self.assertEqual(self.claim('a.pdf'), os.path.join(self.tmp, 'a_2.pdf'))
+        self.assertEqual(self.claim('a.pdf'), os.path.join(self.tmp, 'a_3.pdf'))
+        self.assertFolderHolds('a.pdf', 'a_1.pdf', 'a_2.pdf', 'a_3.pdf')
+
+    def test_counter_skips_files_created_meanwhile(self):
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        self.assertEqual(self.claim('a.pdf'), os.path.join(self.tmp, 'a_1.pdf'))
+        touch(os.path.join(self.tmp, 'a_2.pdf'))
+        self.assertEqual(self.claim('a.pdf'), os.path.join(self.tmp, 'a_3.pdf'))
+
+
+class NewGuiClaimTest(FolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.gui = file_classifier_gui_new.SimpleFileOrganizerGUI.__new__(
+            file_classifier_gui_new.SimpleFileOrganizerGUI)
+        self.gui._folder_names = {}
+
+    def test_conflicts_are_numbered(self):
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        touch(os.path.join(self.tmp, 'a_1.pdf'))
+        self.assertEqual(self.gui._claim_destination(self.tmp, 'a.pdf'),
+                         os.path.join(self.tmp, 'a_2.pdf'))
+        self.assertEqual(self.gui._claim_destination(self.tmp, 'a.pdf'),
+                         os.path.join(self.tmp, 'a_3.pdf'))
+        self.assertFolderHolds('a.pdf', 'a_1.pdf', 'a_2.pdf', 'a_3.pdf')
+
+    def test_file_created_after_listing(self):
+        self.gui._claim_destination(self.tmp, 'b.pdf')
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        self.assertEqual(self.gui._claim_destination(self.tmp, 'a.pdf'),
+                         os.path.join(self.tmp, 'a_1.pdf'))
+
+    def test_move_replaces_placeholder(self):
+        src_dir = tempfile.mkdtemp()
+        try:
+            src = os.path.join(src_dir, 'a.pdf')
+            with open(src, 'w') as f:
+                f.write('data')
+            self.gui._place_file(src, 'a.pdf', self.tmp)
+            with open(os.path.join(self.tmp, 'a.pdf')) as f:
+                self.assertEqual(f.read(), 'data')
+            self.assertFalse(os.path.exists(src))
+        finally:
+            shutil.rmtree(src_dir)
+
+    def test_failed_move_releases_claim(self):
+        with self.assertRaises(FileNotFoundError):
+            self.gui._place_file(os.path.join(self.tmp, 'gone', 'a.pdf'), 'a.pdf', self.tmp)
+        self.assertFolderHolds()
+
+
+class WatchdogOrganizeTest(FolderTestCase):
+
+    def test_conflicts_are_numbered(self):
+        touch(os.path.join(self.tmp, 'a.pdf'))
+        touch(os.path.join(self.tmp, 'a_1.pdf'))
+        claimed = file_classifier_gui_watchdog._reserve_unique_path(self.tmp, 'a', '.pdf')
+        self.assertEqual(claimed, os.path.join(self.tmp, 'a_2.pdf'))
+        self.assertFolderHolds('a.pdf', 'a_1.pdf', 'a_2.pdf')
+
+    def test_recreates_removed_folder(self):
+        folder = os.path.join(self.tmp, 'Docs')
+        claimed = file_classifier_gui_watchdog._reserve_unique_path(folder, 'a', '.pdf')
+        self.assertEqual(claimed, os.path.join(folder, 'a.pdf'))
+        self.assertTrue(os.path.isfile(claimed))
+
+    def test_organize_moves_into_category(self):
+        src = os.path.join(self.tmp, 'a.pdf')
+        touch(src)
+        created_dirs = set()
+        category, destination = file_classifier_gui_watchdog._do_organize(
+            self.tmp, src, 'a.pdf', {'folder_name': 'Docs'}, created_dirs)
+        self.assertEqual(category, 'Docs')
+        self.assertEqual(destination, os.path.join(self.tmp, 'Docs', 'a.pdf'))
+        self.assertIn(os.path.join(self.tmp, 'Docs'), created_dirs)
+        self.assertFolderHolds('Docs')
+
+    def test_failed_move_releases_claim(self):
+        missing = os.path.join(self.tmp, 'gone.pdf')
+        with self.assertRaises(FileNotFoundError):
+            file_classifier_gui_watchdog._do_organize(
+                self.tmp, missing, 'gone.pdf', {'folder_name': 'Docs'}, set())
+        self.assertEqual(os.listdir(os.path.join(self.tmp, 'Docs')), [])
+
+    def test_prediction_error_moves_nothing(self):
+        src = os.path.join(self.tmp, 'a.pdf')
+        touch(src)
+        with self.assertRaises(RuntimeError):
+            file_classifier_gui_watchdog._do_organize(
+                self.tmp, src, 'a.pdf', {'error': 'boom'}, set())
+        self.assertFolderHolds('a.pdf')
+
+
+class WatchdogClassifyTest(FolderTestCase):
+    """_classify_files() mixes the extension table with one predict_batch call."""
+
+    def test_matches_lookup_then_batch(self):
+        classifier = RandomForestFileClassifier()
+        classifier.load_model(MODEL_PATH)
+        paths = create_sample_files(self.tmp, limit=120)
+
+        expected = []
+        for path in paths:
+            result = classifier.predict_from_extension(path) or classifier.predict(path)
+            expected.append(result['predicted_category'])
+
+        results = file_classifier_gui_watchdog._classify_files(classifier, paths)
+        self.assertEqual([r['predicted_category'] for r in results], expected)
+        self.assertEqual([r['filename'] for r in results], [os.path.basename(p) for p in paths])
+        self.assertTrue(any(r.get('route') == 'lut' for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
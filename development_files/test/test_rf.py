@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Random Forest Backend Tests - every prediction route must match sklearn
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_classifier import MODEL_PATH, create_sample_files
+from random_forest_classifier import RandomForestFileClassifier, COMPILED_MODEL_SUFFIX
+
+HAS_ONNX = all(importlib.util.find_spec(name) for name in ('skl2onnx', 'onnxruntime'))
+HAS_TREELITE = all(importlib.util.find_spec(name) for name in ('treelite', 'tl2cgen'))
+
+
+class BackendTestCase(unittest.TestCase):
+    """Load a fresh classifier per test and compare it against plain sklearn."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp()
+        cls.paths = create_sample_files(cls.tmp, limit=150)
+        reference = RandomForestFileClassifier()
+        reference.load_model(MODEL_PATH)
+        cls.expected = reference.predict_batch(cls.paths)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp)
+
+    def setUp(self):
+        self.classifier = RandomForestFileClassifier()
+        self.classifier.load_model(MODEL_PATH)
+
+    def assertMatchesReference(self, results, places=9):
+        self.assertEqual(len(results), len(self.expected))
+        for e, a in zip(self.expected, results):
+            self.assertNotIn('error', a)
+            self.assertEqual(e['predicted_category'], a['predicted_category'], a['filename'])
+            self.assertAlmostEqual(e['confidence'], a['confidence'], places=places)
+
+    def assertBothRoutesMatch(self, places=9):
+        # predict() sends one row at a time, predict_batch() the whole matrix
+        self.assertMatchesReference([self.classifier.predict(p) for p in self.paths], places)
+        self.assertMatchesReference(self.classifier.predict_batch(self.paths), places)
+
+
+class RoundRobinTest(BackendTestCase):
+
+    def test_roundrobin_matches_sklearn(self):
+        self.assertBothRoutesMatch()
+
+    def test_quantized_matches_sklearn(self):
+        self.classifier.quantize_thresholds()
+        self.assertIsNotNone(self.classifier.threshold_edges)
+        self.assertBothRoutesMatch()
+
+    def test_quantized_survives_save_and_load(self):
+        self.classifier.quantize_thresholds()
+        model_path = os.path.join(self.tmp, 'quantized.joblib')
+        self.classifier.save_model(model_path, quantized=True)
+
+        self.classifier = RandomForestFileClassifier()
+        self.classifier.load_model(model_path)
+        self.assertIsNotNone(self.classifier.threshold_edges)
+        self.assertBothRoutesMatch()
+
+
+@unittest.skipUnless(HAS_ONNX, "skl2onnx and onnxruntime are required")
+class OnnxBackendTest(BackendTestCase):
+
+    def test_onnx_matches_sklearn(self):
+        onnx_path = os.path.join(self.tmp, 'model.onnx')
+        self.assertTrue(self.classifier.export_onnx(onnx_path))
+        self.assertTrue(self.classifier.load_onnx(onnx_path))
+        # ONNX Runtime accumulates tree votes in float32
+        self.assertBothRoutesMatch(places=5)
+
+    def test_missing_onnx_file_keeps_sklearn(self):
+        self.assertFalse(self.classifier.load_onnx(os.path.join(self.tmp, 'missing.onnx')))
+        self.assertIsNone(self.classifier.onnx_session)
+
+
+@unittest.skipUnless(HAS_TREELITE, "treelite and tl2cgen are required")
+class CompiledBackendTest(BackendTestCase):
+
+    def test_compiled_matches_sklearn(self):
+        lib_path = os.path.join(self.tmp, 'model' + COMPILED_MODEL_SUFFIX)
+        if not self.classifier.export_compiled(lib_path):
+            self.skipTest("model could not be compiled (no C toolchain?)")
+        self.assertTrue(self.classifier.load_compiled(lib_path))
+        self.assertBothRoutesMatch(places=5)
+
+    def test_missing_library_keeps_sklearn(self):
+        lib_path = os.path.join(self.tmp, 'missing' + COMPILED_MODEL_SUFFIX)
+        self.assertFalse(self.classifier.load_compiled(lib_path))
+        self.assertIsNone(self.classifier.compiled_predictor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,16 +6,314 @@ Real-time file monitoring and automatic organization
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import errno
 import os
+import queue
 import sys
 import threading
 import shutil
+import stat
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import (
+    FileClosedEvent, FileCreatedEvent, FileModifiedEvent, FileMovedEvent,
+    FileSystemEventHandler
+)
+from watchdog.utils import UnsupportedLibcError
 from random_forest_classifier import RandomForestFileClassifier
 
+# inotify (Linux only) is the one backend that reports close-write events;
+# elsewhere the module fails to import or finds no inotify in libc
+try:
+    from watchdog.observers.inotify import InotifyObserver
+except (ImportError, UnsupportedLibcError):
+    InotifyObserver = None
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+                                      wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD,
+                                      wintypes.HANDLE]
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+else:
+    import fcntl
+
+# Windows can tell exactly whether a file is still open elsewhere; other
+# platforms only see writers that lock the file, so sizes are compared too
+CLOSE_PROBE_EXACT = sys.platform == 'win32'
+
+# Events the handler reacts to. inotify reports a writer closing the file,
+# so on Linux the mask is create/move/close-write and neither reads nor
+# individual writes wake the observer; other backends and the polling
+# observer have no close event and need modify events to see a file grow
+WATCHED_EVENTS = [FileCreatedEvent, FileMovedEvent, FileClosedEvent]
+WATCHED_EVENTS_NO_CLOSE = WATCHED_EVENTS + [FileModifiedEvent]
+
+# Partial downloads and system files are never organized (same set as
+# development_files/auto_file_organizer.py)
+IGNORED_EXTENSIONS = frozenset({'.tmp', '.temp', '.crdownload', '.part', '.downloading', '.download'})
+IGNORED_NAMES = frozenset({'.DS_Store', 'Thumbs.db', '.gitkeep', '.placeholder'})
+
+# Filesystems whose native change notifications can't be relied on
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p'}
+
+
+def _is_ignored(filename):
+    """Tell whether a file is a partial download or system file to leave alone."""
+    if filename in IGNORED_NAMES:
+        return True
+    return os.path.splitext(filename)[1].lower() in IGNORED_EXTENSIONS
+
+
+def _is_network_path(path):
+    """
+    Tell whether a folder lives on a network drive or share.
+    
+    Native change notifications miss events on SMB/NFS mounts, so such
+    folders are watched by polling instead.
+    
+    Args:
+        path: Folder to check
+        
+    Returns:
+        True for network drives, False for local ones or when unknown
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            drive = os.path.splitdrive(os.path.abspath(path))[0]
+            if drive.startswith('\\\\'):
+                return True  # UNC path (\\server\share)
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE
+        
+        if sys.platform.startswith('linux'):
+            # Longest mount point containing the folder decides its type
+            real_path = os.path.realpath(path)
+            best_mount, fs_type = '', ''
+            with open('/proc/mounts') as mounts:
+                for line in mounts:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    mount_point = fields[1].replace('\\040', ' ')
+                    inside = (real_path == mount_point or
+                              real_path.startswith(mount_point.rstrip('/') + '/'))
+                    if inside and len(mount_point) > len(best_mount):
+                        best_mount, fs_type = mount_point, fields[2]
+            return fs_type in NETWORK_FS_TYPES
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def _is_file_closed(path):
+    """
+    Ask the OS whether another program still has a file open.
+    
+    On Windows an exclusive open fails with a sharing violation while any
+    other handle to the file exists. Elsewhere a non-blocking shared flock
+    only fails while a writer holds an exclusive lock.
+    
+    Args:
+        path: File to probe
+        
+    Returns:
+        False if the file is known to be in use, True otherwise
+    """
+    if sys.platform == 'win32':
+        GENERIC_READ = 0x80000000
+        OPEN_EXISTING = 3
+        ERROR_SHARING_VIOLATION = 32
+        handle = _kernel32.CreateFileW(path, GENERIC_READ, 0, None, OPEN_EXISTING, 0, None)
+        if handle is None or handle == ctypes.c_void_p(-1).value:
+            return ctypes.get_last_error() != ERROR_SHARING_VIOLATION
+        _kernel32.CloseHandle(handle)
+        return True
+    
+    try:
+        # Non-blocking, so a FIFO or device can't hang the worker
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return True  # Gone or unreadable; the caller's stat decides
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)  # Also drops the probe lock
+
+
+def _reserve_unique_path(folder, base, ext):
+    """
+    Claim a free file name in folder.
+    
+    The name is created empty with O_CREAT | O_EXCL, so checking for a
+    conflict and taking the name is one atomic syscall and no other
+    writer can take it in between; the move then replaces the placeholder.
+    A folder removed since it was created (and cached) is created again.
+    
+    Args:
+        folder: Destination folder
+        base: File name without extension
+        ext: Extension, including the dot
+        
+    Returns:
+        The claimed path (base + ext, or base_N + ext on conflict)
+    """
+    counter = 0
+    while True:
+        name = f"{base}{ext}" if counter == 0 else f"{base}_{counter}{ext}"
+        candidate = f"{folder}{os.sep}{name}"
+        try:
+            os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            return candidate
+        except FileExistsError:
+            counter += 1
+        except FileNotFoundError:
+            os.makedirs(folder, exist_ok=True)
+
+
+def _fast_move(src, dst):
+    """
+    Move a file with a single rename, copying only across filesystems.
+    
+    Category folders live inside the organized folder, so the rename
+    almost always succeeds; it also replaces the placeholder left by
+    _reserve_unique_path on every platform.
+    
+    Args:
+        src: Path of the file to move
+        dst: Destination file path
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _classify_files(classifier, files):
+    """
+    Classify several files, skipping the forest where the extension decides.
+    
+    Extensions with a fixed category come from the classifier's lookup
+    table; the rest go through one predict_batch call.
+    
+    Args:
+        classifier: Loaded RandomForestFileClassifier
+        files: File paths to classify
+        
+    Returns:
+        Prediction dicts in the same order as files
+    """
+    results = [classifier.predict_from_extension(f) for f in files]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if pending:
+        batch_results = classifier.predict_batch(
+            [files[i] for i in pending],
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        )
+        for i, result in zip(pending, batch_results):
+            results[i] = result
+    return results
+
+
+def _do_organize(target_folder, file_path, filename, result, created_dirs):
+    """
+    Move a classified file into its category folder under target_folder.
+    
+    Shared by the watchdog handler and both bulk paths so the folder
+    cache, name reservation and rename logic live in one place.
+    
+    Args:
+        target_folder: Folder that holds the category folders
+        file_path: Path of the file to move
+        filename: Base name of file_path, as already known to the caller
+        result: Prediction dict for the file
+        created_dirs: Set of category folders already known to exist
+        
+    Returns:
+        (category, destination) tuple
+    """
+    if 'error' in result:
+        raise RuntimeError(result['error'])
+    category = result['folder_name']
+    
+    # Create category folder if it doesn't exist
+    category_folder = os.path.join(target_folder, category)
+    if category_folder not in created_dirs:
+        os.makedirs(category_folder, exist_ok=True)
+        created_dirs.add(category_folder)
+    
+    # Move file to category folder, handling name conflicts
+    base_name, ext = os.path.splitext(filename)
+    destination = _reserve_unique_path(category_folder, base_name, ext)
+    try:
+        _fast_move(file_path, destination)
+    except Exception:
+        # Release the claimed name
+        try:
+            os.unlink(destination)
+        except OSError:
+            pass
+        raise
+    return category, destination
+
+
+def _organize_entries(target_folder, entries, results, created_dirs):
+    """
+    Move classified files into their category folders.
+    
+    On network folders each rename waits on a server round trip, so the
+    moves run on a small thread pool and overlap; locally a plain loop
+    is faster than the pool's hand-off.
+    
+    Args:
+        target_folder: Folder that holds the category folders
+        entries: DirEntry objects of the files to move
+        results: Prediction dicts, in the same order as entries
+        created_dirs: Set of category folders already known to exist
+        
+    Yields:
+        (entry, category, error) per file as it finishes; error is None
+        on success, category is None on failure
+    """
+    organize = _do_organize
+    if not _is_network_path(target_folder):
+        for entry, result in zip(entries, results):
+            try:
+                category, _ = organize(target_folder, entry.path, entry.name, result, created_dirs)
+            except Exception as e:
+                yield entry, None, e
+            else:
+                yield entry, category, None
+        return
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(organize, target_folder, entry.path, entry.name, result, created_dirs): entry
+            for entry, result in zip(entries, results)
+        }
+        for future in as_completed(futures):
+            try:
+                category, _ = future.result()
+            except Exception as e:
+                yield futures[future], None, e
+            else:
+                yield futures[future], category, None
+
 
 class FileOrganizerHandler(FileSystemEventHandler):
     """Handler for file system events."""
@@ -24,72 +322,125 @@ class FileOrganizerHandler(FileSystemEventHandler):
         self.classifier = classifier
         self.target_folder = target_folder
         self.status_callback = status_callback
-        self.processing_files = set()  # Track files being processed
+        self._created_dirs = set()  # Category folders known to exist
+        
+        # Events are coalesced per path and handled by one worker thread
+        self._event_q = queue.Queue()
+        self._pending = {}  # path -> monotonic time it is due for a check
+        # Quiet time after the last event for a path; with an exact
+        # open-file probe there is no need to wait long
+        self._debounce = 0.1 if CLOSE_PROBE_EXACT else 1.0
+        self._stable_interval = 0.5  # Delay between size checks
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         
     def on_created(self, event):
         """Handle file creation events."""
         if event.is_directory:
             return
-            
-        file_path = event.src_path
-        
-        # Skip if file is already being processed
-        if file_path in self.processing_files:
+        self.queue_path(event.src_path)
+    
+    def on_modified(self, event):
+        """Handle file modification events (a download still being written)."""
+        if event.is_directory:
             return
-            
-        # Wait a bit to ensure file is fully written
-        threading.Thread(target=self._process_file_delayed, args=(file_path,), daemon=True).start()
+        self.queue_path(event.src_path)
     
-    def _process_file_delayed(self, file_path):
-        """Process file after a short delay to ensure it's fully written."""
-        time.sleep(1)  # Wait 1 second
-        
-        # Check if file still exists and is stable
-        if not os.path.exists(file_path):
+    def on_moved(self, event):
+        """Handle renames into the folder (e.g. file.crdownload -> file.pdf)."""
+        if event.is_directory:
+            return
+        # Files the organizer moves into category folders land elsewhere;
+        # the folder from filedialog may use other slashes or case on Windows
+        dest_folder = os.path.normcase(os.path.normpath(os.path.dirname(event.dest_path)))
+        if dest_folder == os.path.normcase(os.path.normpath(self.target_folder)):
+            self.queue_path(event.dest_path)
+    
+    def on_closed(self, event):
+        """Handle a writer closing a file, usually the end of a download."""
+        if event.is_directory:
+            return
+        self.queue_path(event.src_path)
+    
+    def queue_path(self, path):
+        """Schedule a file for organizing once it has settled."""
+        if _is_ignored(os.path.basename(path)):
             return
+        self._event_q.put((path, time.monotonic()))
+    
+    def stop(self):
+        """Stop the worker thread; pending files are dropped."""
+        self._event_q.put(None)
+    
+    def _worker_loop(self):
+        """Organize files once their events are quiet and they are no longer being written."""
+        pending = self._pending
+        sizes = {}  # path -> size seen at the previous check
+        
+        while True:
+            # Sleep until the next event or until the earliest path is due
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(pending.values()) - time.monotonic())
+            try:
+                item = self._event_q.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
             
-        try:
-            # Check if file size is stable (not still being written)
-            initial_size = os.path.getsize(file_path)
-            time.sleep(0.5)
-            if os.path.getsize(file_path) != initial_size:
-                return  # File still being written
-                
-            self.processing_files.add(file_path)
-            self._organize_file(file_path)
+            if item is None:
+                return
+            if item:
+                # Another event for the path restarts its quiet period
+                path, ts = item
+                pending[path] = ts + self._debounce
             
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-        finally:
-            self.processing_files.discard(file_path)
+            now = time.monotonic()
+            for path, due in list(pending.items()):
+                if due > now:
+                    continue
+                
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    st = None
+                if st is None or not stat.S_ISREG(st.st_mode):
+                    # Moved away or deleted before we got to it, or a FIFO,
+                    # socket or device rather than a downloaded file
+                    del pending[path]
+                    sizes.pop(path, None)
+                    continue
+                size = st.st_size
+                
+                if not _is_file_closed(path):
+                    # Still open in the program writing it
+                    pending[path] = now + self._stable_interval
+                    continue
+                
+                if not CLOSE_PROBE_EXACT and sizes.get(path) != size:
+                    # First check, or still being written: look again shortly
+                    sizes[path] = size
+                    pending[path] = now + self._stable_interval
+                    continue
+                
+                del pending[path]
+                sizes.pop(path, None)
+                self._organize_file(path)
     
     def _organize_file(self, file_path):
         """Organize a single file."""
         try:
+            filename = os.path.basename(file_path)
+            if _is_ignored(filename):
+                return
             if self.status_callback:
-                filename = os.path.basename(file_path)
                 self.status_callback(f"▸ Auto-organizing: {filename[:20]}...")
             
-            # Classify file
-            result = self.classifier.predict(file_path)
-            category = result['folder_name']
-            
-            # Create category folder if it doesn't exist
-            category_folder = os.path.join(self.target_folder, category)
-            os.makedirs(category_folder, exist_ok=True)
-            
-            # Move file to category folder
-            destination = os.path.join(category_folder, os.path.basename(file_path))
-            
-            # Handle name conflicts
-            counter = 1
-            base_name, ext = os.path.splitext(os.path.basename(file_path))
-            while os.path.exists(destination):
-                new_name = f"{base_name}_{counter}{ext}"
-                destination = os.path.join(category_folder, new_name)
-                counter += 1
-            
-            shutil.move(file_path, destination)
+            # Unambiguous extensions skip the classifier
+            result = self.classifier.predict_from_extension(file_path)
+            if result is None:
+                result = self.classifier.predict(file_path, use_cache=True)
+            category, _ = _do_organize(
+                self.target_folder, file_path, filename, result, self._created_dirs
+            )
             
             if self.status_callback:
                 self.status_callback(f"✓ Moved to {category}")
@@ -97,6 +448,91 @@ class FileOrganizerHandler(FileSystemEventHandler):
         except Exception as e:
             print(f"Error organizing {file_path}: {e}")
 
+
+class _NativeWatcher:
+    """
+    Watch a folder with inotifywait or fswatch instead of watchdog.
+    
+    The tool runs as a subprocess and prints one path per event, which a
+    reader thread passes to the handler. Only the parts of the watchdog
+    observer interface used here are provided.
+    """
+    
+    def __init__(self):
+        self.handler = None
+        self.path = None
+        self._proc = None
+        self._reader = None
+    
+    @staticmethod
+    def command(path):
+        """
+        Build the watcher command line for this system.
+        
+        Args:
+            path: Folder to watch (not recursive)
+            
+        Returns:
+            (argv, separator) tuple, or None if no native tool is installed
+        """
+        if sys.platform.startswith('linux') and shutil.which('inotifywait'):
+            return (['inotifywait', '-m', '-q',
+                     '-e', 'create', '-e', 'close_write', '-e', 'moved_to',
+                     '--format', '%w%f', path], b'\n')
+        if shutil.which('fswatch'):
+            return (['fswatch', '-0',
+                     '--event', 'Created', '--event', 'Updated', '--event', 'MovedTo',
+                     path], b'\0')
+        return None
+    
+    def schedule(self, handler, path, recursive=False, event_filter=None):
+        """Set the handler and folder; only non-recursive watches are supported."""
+        self.handler = handler
+        self.path = path
+    
+    def start(self):
+        """Start the watcher process and its reader thread."""
+        argv, sep = self.command(self.path)
+        self._proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL)
+        self._reader = threading.Thread(target=self._read_events, args=(sep,), daemon=True)
+        self._reader.start()
+    
+    def _read_events(self, sep):
+        """Pass each reported file in the watched folder to the handler."""
+        # fswatch reports resolved paths (/private/var/..., the target of a
+        # symlinked Downloads folder), so both sides are resolved
+        folder = os.path.normcase(os.path.realpath(self.path))
+        fd = self._proc.stdout.fileno()
+        buffer = b''
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            *paths, buffer = (buffer + data).split(sep)
+            for raw in paths:
+                path = os.fsdecode(raw)
+                # fswatch also reports the category folders being filled
+                if not path:
+                    continue
+                if os.path.normcase(os.path.realpath(os.path.dirname(path))) != folder:
+                    continue
+                if not os.path.isdir(path):
+                    self.handler.queue_path(path)
+    
+    def stop(self):
+        """Terminate the watcher process."""
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+    
+    def join(self):
+        """Wait for the watcher process and reader thread to finish."""
+        if self._proc:
+            self._proc.wait()
+        if self._reader:
+            self._reader.join(timeout=1.0)
+
+
 class ModernFileOrganizerWithWatchdog:
     def __init__(self, root):
         self.root = root
@@ -135,12 +571,21 @@ class ModernFileOrganizerWithWatchdog:
         except:
             pass
         
-        # Initialize classifier and watchdog
+        # Initialize classifier and watchdog; the model is loaded in the
+        # background once the window is up
         self.classifier = None
+        self._classifier_ready = threading.Event()
         self.observer = None
+        # Opt-in: watch through inotifywait/fswatch when one is installed
+        self.use_native_watcher = os.environ.get('DOWNFILEORG_NATIVE_WATCHER') == '1'
         self.is_watching = False
         self.handler = None
-        self.load_classifier()
+        self._created_dirs = set()  # Category folders known to exist
+        # Pending UI updates from worker threads: widget -> config kwargs, or
+        # callable -> None. One entry per target, so the backlog stays small
+        # even while a modal dialog keeps the Tk thread from draining it
+        self._ui_pending = {}
+        self._ui_lock = threading.Lock()
         
         # Default to Downloads folder
         self.downloads_path = str(Path.home() / "Downloads")
@@ -157,6 +602,13 @@ class ModernFileOrganizerWithWatchdog:
         # Update file count initially
         self.update_file_count()
         
+        # Worker threads never touch Tk; their updates are applied here
+        self.root.after(50, self._drain_ui_queue)
+        
+        # Paint the window, then deserialize the model off the Tk thread
+        self.root.update_idletasks()
+        threading.Thread(target=self.load_classifier, daemon=True).start()
+        
     def setup_styles(self):
         """Setup modern ttk styles."""
         style = ttk.Style()
@@ -173,9 +625,15 @@ class ModernFileOrganizerWithWatchdog:
         )
         
     def load_classifier(self):
-        """Load the trained Random Forest classifier."""
+        """
+        Load the trained Random Forest classifier.
+        
+        Runs on a background thread once the window is shown; the outcome
+        reaches the AI status label through the UI queue.
+        """
+        error = None
         try:
-            self.classifier = RandomForestFileClassifier()
+            classifier = RandomForestFileClassifier()
             
             # Get the correct path for the model file
             if getattr(sys, 'frozen', False):
@@ -187,12 +645,39 @@ class ModernFileOrganizerWithWatchdog:
                 model_path = 'rf_file_classifier.joblib'
             
             if os.path.exists(model_path):
-                self.classifier.load_model(model_path)
+                classifier.load_model(model_path)
+                self.classifier = classifier
                 print("✅ Classifier loaded successfully")
             else:
-                messagebox.showerror("Error", f"Model file not found at: {model_path}")
+                error = f"Model file not found at: {model_path}"
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load classifier: {e}")
+            error = f"Failed to load classifier: {e}"
+        finally:
+            self._classifier_ready.set()
+        
+        if self.classifier:
+            self._post_ui(self.ai_status_label, {
+                'text': "🤖 AI Ready",
+                'fg': self.colors['accent_green']
+            })
+        else:
+            self._post_ui(self.ai_status_label, {
+                'text': "❌ AI Error",
+                'fg': self.colors['error']
+            })
+        if error:
+            self._post_ui(partial(messagebox.showerror, "Error", error), None)
+    
+    def _classifier_available(self):
+        """Tell whether the classifier can be used, explaining to the user if not."""
+        if self.classifier:
+            return True
+        
+        if not self._classifier_ready.is_set():
+            messagebox.showinfo("ⓘ Information", "The AI model is still loading, please try again in a moment.")
+        else:
+            messagebox.showerror("Error", "AI Classifier not loaded!")
+        return False
     
     def create_modern_widgets(self):
         """Create modern, beautiful widgets."""
@@ -348,17 +833,15 @@ class ModernFileOrganizerWithWatchdog:
         ai_frame = tk.Frame(stats_container, bg=self.colors['bg_card'])
         ai_frame.pack(side='left', fill='x', expand=True)
         
-        ai_status = "🤖 AI Ready" if self.classifier else "❌ AI Error"
-        ai_color = self.colors['accent_green'] if self.classifier else self.colors['error']
-        
-        ai_status_label = tk.Label(
+        # Updated by load_classifier() once the model is in
+        self.ai_status_label = tk.Label(
             ai_frame,
-            text=ai_status,
+            text="⏳ Loading AI...",
             font=('Arial', 16, 'bold'),  # Much larger font
-            fg=ai_color,
+            fg=self.colors['text_muted'],
             bg=self.colors['bg_card']
         )
-        ai_status_label.pack()
+        self.ai_status_label.pack()
         
         tk.Label(
             ai_frame,
@@ -540,6 +1023,21 @@ class ModernFileOrganizerWithWatchdog:
         )
         description.pack(anchor='w')
         
+        # Polling fallback for folders whose change events are unreliable
+        self.force_polling_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            content_frame,
+            text="Force polling (for network drives)",
+            variable=self.force_polling_var,
+            font=('Arial', 12),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_card'],
+            activebackground=self.colors['bg_card'],
+            activeforeground=self.colors['text_primary'],
+            selectcolor=self.colors['bg_secondary'],
+            cursor='hand2'
+        ).pack(anchor='w', pady=(10, 0))
+        
         # Add hover effects
         self.add_hover_effect(self.organize_btn, self.colors['accent_blue'], '#2563eb')
         self.add_hover_effect(self.watchdog_toggle_btn, self.colors['accent_green'], '#059669')
@@ -614,6 +1112,7 @@ class ModernFileOrganizerWithWatchdog:
                 
             self.folder_var.set(folder)
             self.downloads_path = folder
+            self._created_dirs = set()
             self.update_file_count()
     
     def update_file_count(self):
@@ -637,9 +1136,9 @@ class ModernFileOrganizerWithWatchdog:
         """Count files in the selected folder."""
         try:
             if os.path.exists(self.downloads_path):
-                files = [f for f in os.listdir(self.downloads_path) 
-                        if os.path.isfile(os.path.join(self.downloads_path, f))]
-                return len(files)
+                # DirEntry knows its type, so no stat per entry
+                with os.scandir(self.downloads_path) as entries:
+                    return sum(1 for entry in entries if entry.is_file(follow_symlinks=False))
         except:
             pass
         return 0
@@ -653,8 +1152,7 @@ class ModernFileOrganizerWithWatchdog:
     
     def start_watchdog(self):
         """Start watchdog monitoring."""
-        if not self.classifier:
-            messagebox.showerror("Error", "AI Classifier not loaded!")
+        if not self._classifier_available():
             return
         
         if not os.path.exists(self.downloads_path):
@@ -668,8 +1166,19 @@ class ModernFileOrganizerWithWatchdog:
                 self.update_watchdog_status
             )
             
-            self.observer = Observer()
-            self.observer.schedule(self.handler, self.downloads_path, recursive=False)
+            # Native events are unreliable on network shares; poll those
+            if self.force_polling_var.get() or _is_network_path(self.downloads_path):
+                self.observer = PollingObserver(timeout=2.0)
+            elif self.use_native_watcher and _NativeWatcher.command(self.downloads_path):
+                self.observer = _NativeWatcher()
+            else:
+                self.observer = Observer()
+            if InotifyObserver is not None and isinstance(self.observer, InotifyObserver):
+                events = WATCHED_EVENTS
+            else:
+                events = WATCHED_EVENTS_NO_CLOSE
+            self.observer.schedule(self.handler, self.downloads_path, recursive=False,
+                                   event_filter=events)
             self.observer.start()
             
             self.is_watching = True
@@ -698,79 +1207,59 @@ class ModernFileOrganizerWithWatchdog:
         def organize_worker():
             try:
                 # Get all existing files
-                files = []
-                for item in os.listdir(self.downloads_path):
-                    item_path = os.path.join(self.downloads_path, item)
-                    if os.path.isfile(item_path):
-                        files.append(item_path)
+                with os.scandir(self.downloads_path) as entries:
+                    found = [entry for entry in entries
+                             if entry.is_file(follow_symlinks=False)
+                             and not _is_ignored(entry.name)]
                 
-                if not files:
-                    self.root.after(0, lambda: self.status_label.config(
-                        text="▶ Watching for new files...",
-                        fg=self.colors['accent_green']
-                    ))
+                if not found:
+                    self._post_ui(self.status_label, {
+                        'text': "▶ Watching for new files...",
+                        'fg': self.colors['accent_green']
+                    })
                     return
                 
+                # Classify all files with at most one forest evaluation
+                results = _classify_files(self.classifier, [entry.path for entry in found])
+                
+                # Use the same organization logic as the handler
                 organized_count = 0
-                for file_path in files:
-                    try:
-                        filename = os.path.basename(file_path)
-                        self.root.after(0, lambda name=filename: self.status_label.config(
-                            text=f"▣ Organizing existing: {name[:20]}...",
-                            fg=self.colors['accent_orange']
-                        ))
-                        
-                        # Use the same organization logic as the handler
-                        result = self.classifier.predict(file_path)
-                        category = result['folder_name']
-                        
-                        # Create category folder if it doesn't exist
-                        category_folder = os.path.join(self.downloads_path, category)
-                        os.makedirs(category_folder, exist_ok=True)
-                        
-                        # Move file to category folder
-                        destination = os.path.join(category_folder, os.path.basename(file_path))
-                        
-                        # Handle name conflicts
-                        counter = 1
-                        base_name, ext = os.path.splitext(os.path.basename(file_path))
-                        while os.path.exists(destination):
-                            new_name = f"{base_name}_{counter}{ext}"
-                            destination = os.path.join(category_folder, new_name)
-                            counter += 1
-                        
-                        shutil.move(file_path, destination)
-                        organized_count += 1
-                        
-                    except Exception as e:
-                        print(f"Error organizing existing file {file_path}: {e}")
+                moved = _organize_entries(self.downloads_path, found, results, self._created_dirs)
+                for i, (entry, category, error) in enumerate(moved):
+                    # One status update per 20 files keeps the Tk queue short
+                    if i % 20 == 0:
+                        self._post_ui(self.status_label, {
+                            'text': f"▣ Organizing existing: {entry.name[:20]}...",
+                            'fg': self.colors['accent_orange']
+                        })
+                    
+                    if error is not None:
+                        print(f"Error organizing existing file {entry.path}: {error}")
                         continue
+                    organized_count += 1
                 
                 # Update UI when done
-                self.root.after(0, lambda: self.update_file_count())
+                self._post_ui(self.update_file_count, None)
                 
                 if organized_count > 0:
-                    self.root.after(0, lambda: self.status_label.config(
-                        text=f"✓ Organized {organized_count} existing files. Now watching...",
-                        fg=self.colors['accent_green']
-                    ))
+                    self._post_ui(self.status_label, {
+                        'text': f"✓ Organized {organized_count} existing files. Now watching...",
+                        'fg': self.colors['accent_green']
+                    })
                     # Reset to watching status after 3 seconds
-                    self.root.after(3000, lambda: self.status_label.config(
-                        text="▶ Watching for new files...",
-                        fg=self.colors['accent_green']
-                    ) if self.is_watching else None)
+                    self._post_ui(self._reset_status_later, None)
                 else:
-                    self.root.after(0, lambda: self.status_label.config(
-                        text="▶ Watching for new files...",
-                        fg=self.colors['accent_green']
-                    ))
+                    self._post_ui(self.status_label, {
+                        'text': "▶ Watching for new files...",
+                        'fg': self.colors['accent_green']
+                    })
                     
             except Exception as e:
                 print(f"Error organizing existing files: {e}")
-                self.root.after(0, lambda: self.status_label.config(
-                    text="▶ Watching for new files...",
-                    fg=self.colors['accent_green']
-                ))
+                self._post_ui(self.status_label, {
+                    'text': "▶ Watching for new files...",
+                    'fg': self.colors['accent_green']
+                })
         
         # Run in separate thread to avoid blocking UI
         thread = threading.Thread(target=organize_worker, daemon=True)
@@ -782,6 +1271,9 @@ class ModernFileOrganizerWithWatchdog:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+        if self.handler:
+            self.handler.stop()
+            self.handler = None
         
         self.is_watching = False
         self.watchdog_toggle_btn.config(
@@ -800,22 +1292,57 @@ class ModernFileOrganizerWithWatchdog:
     
     def update_watchdog_status(self, message):
         """Update watchdog status from handler."""
-        def update_ui():
-            self.status_label.config(text=message, fg=self.colors['accent_orange'])
-            # Update file count
-            self.update_file_count()
-            # Reset status after 3 seconds
-            self.root.after(3000, lambda: self.status_label.config(
-                text="▶ Watching for new files...",
-                fg=self.colors['accent_green']
-            ) if self.is_watching else None)
-        
-        self.root.after(0, update_ui)
+        self._post_ui(self.status_label, {'text': message, 'fg': self.colors['accent_orange']})
+        # Update file count
+        self._post_ui(self.update_file_count, None)
+        # Reset status after 3 seconds
+        self._post_ui(self._reset_status_later, None)
+    
+    def _reset_status_later(self):
+        """Show the watching message again in 3 seconds, if still watching."""
+        self.root.after(3000, lambda: self.status_label.config(
+            text="▶ Watching for new files...",
+            fg=self.colors['accent_green']
+        ) if self.is_watching else None)
+    
+    def _post_ui(self, target, kwargs):
+        """
+        Queue a UI update from any thread; applied by _drain_ui_queue().
+        
+        A newer update for the same widget (or callable) replaces the older
+        one, so a burst of per-file status messages costs one reconfigure.
+        
+        Args:
+            target: Widget to configure, or callable to run on the Tk thread
+            kwargs: config() keyword arguments, or None to call target
+        """
+        with self._ui_lock:
+            # Re-insert so updates run in the order they were last queued
+            self._ui_pending.pop(target, None)
+            self._ui_pending[target] = kwargs
+    
+    def _drain_ui_queue(self):
+        """Apply the UI updates posted by worker threads, on the Tk thread."""
+        try:
+            with self._ui_lock:
+                latest, self._ui_pending = self._ui_pending, {}
+            
+            for target, kwargs in latest.items():
+                # One failing update (e.g. a destroyed widget) must not
+                # discard the others; they are no longer pending
+                try:
+                    if kwargs is None:
+                        target()
+                    else:
+                        target.config(**kwargs)
+                except Exception as e:
+                    print(f"Error applying UI update: {e}")
+        finally:
+            self.root.after(50, self._drain_ui_queue)
     
     def organize_files(self):
         """Organize all files in the selected folder."""
-        if not self.classifier:
-            messagebox.showerror("Error", "AI Classifier not loaded!")
+        if not self._classifier_available():
             return
         
         if not os.path.exists(self.downloads_path):
@@ -840,66 +1367,47 @@ class ModernFileOrganizerWithWatchdog:
         """Worker thread for file organization."""
         try:
             # Get all files in the folder
-            files = []
-            for item in os.listdir(self.downloads_path):
-                item_path = os.path.join(self.downloads_path, item)
-                if os.path.isfile(item_path):
-                    files.append(item_path)
+            with os.scandir(self.downloads_path) as entries:
+                found = [entry for entry in entries
+                         if entry.is_file(follow_symlinks=False)
+                         and not _is_ignored(entry.name)]
             
-            if not files:
-                self.root.after(0, lambda: self._show_completion("No files to organize!", 'info'))
+            if not found:
+                self._post_ui(partial(self._show_completion, "No files to organize!", 'info'), None)
                 return
             
             # Create organized folders
             organized_count = 0
             categories = set()
             
-            for i, file_path in enumerate(files):
-                try:
-                    # Update status
-                    filename = os.path.basename(file_path)
+            # Classify all files with at most one forest evaluation
+            results = _classify_files(self.classifier, [entry.path for entry in found])
+            
+            moved = _organize_entries(self.downloads_path, found, results, self._created_dirs)
+            for i, (entry, category, error) in enumerate(moved):
+                # Update status once per 20 files
+                if i % 20 == 0:
+                    filename = entry.name
                     display_name = filename[:25] + "..." if len(filename) > 25 else filename
-                    self.root.after(0, lambda name=display_name: 
-                                   self.status_label.config(
-                                       text=f"▸ Processing: {name}",
-                                       fg=self.colors['accent_purple']
-                                   ))
-                    
-                    # Classify file
-                    result = self.classifier.predict(file_path)
-                    category = result['folder_name']  # Use folder_name instead of predicted_category
-                    categories.add(category)
-                    
-                    # Create category folder if it doesn't exist
-                    category_folder = os.path.join(self.downloads_path, category)
-                    os.makedirs(category_folder, exist_ok=True)
-                    
-                    # Move file to category folder
-                    destination = os.path.join(category_folder, os.path.basename(file_path))
-                    
-                    # Handle name conflicts
-                    counter = 1
-                    base_name, ext = os.path.splitext(os.path.basename(file_path))
-                    while os.path.exists(destination):
-                        new_name = f"{base_name}_{counter}{ext}"
-                        destination = os.path.join(category_folder, new_name)
-                        counter += 1
-                    
-                    shutil.move(file_path, destination)
-                    organized_count += 1
-                    
-                except Exception as e:
-                    print(f"Error organizing {file_path}: {e}")
+                    self._post_ui(self.status_label, {
+                        'text': f"▸ Processing: {display_name}",
+                        'fg': self.colors['accent_purple']
+                    })
+                
+                if error is not None:
+                    print(f"Error organizing {entry.path}: {error}")
                     continue
+                categories.add(category)
+                organized_count += 1
             
             # Show completion message
             message = f"✓ Successfully organized {organized_count} files into {len(categories)} categories:\n\n"
             message += " • " + "\n • ".join(sorted(categories))
             
-            self.root.after(0, lambda: self._show_completion(message, 'success'))
+            self._post_ui(partial(self._show_completion, message, 'success'), None)
             
         except Exception as e:
-            self.root.after(0, lambda: self._show_completion(f"❌ Error: {e}", 'error'))
+            self._post_ui(partial(self._show_completion, f"❌ Error: {e}", 'error'), None)
     
     def _show_completion(self, message, msg_type='info'):
         """Show completion message and reset UI."""
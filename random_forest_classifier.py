@@ -11,9 +11,102 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 import joblib
 import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 import json
 
+# Optional: ONNX Runtime gives much faster single-file inference
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+# Optional: tl2cgen runs forests compiled to native code by Treelite
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
+
+# Shared library suffix for the compiled model on this platform
+COMPILED_MODEL_SUFFIX = {'win32': '.dll', 'darwin': '.dylib'}.get(sys.platform, '.so')
+
+# Keywords for each category - match training data
+CATEGORY_KEYWORDS = {
+    'education': ['assignment', 'notes', 'class', 'syllabus', 'exam', 'lecture', 'worksheet', 'college', 'study', 'textbook', 'tutorial', 'course', 'homework', 'quiz', 'test', 'university', 'school', 'academic', 'research', 'thesis', 'dissertation', 'math', 'science', 'biology', 'chemistry', 'physics', 'computer', 'programming', 'algorithm', 'data', 'statistics'],
+    'movies': ['movie', 'film', 'trailer', 'cinema', 'hd', 'bluray', 'dvd', '4k', 'action', 'comedy', 'drama', 'horror', 'thriller', 'adventure', 'fantasy', 'scifi', 'romance', 'animation', 'documentary', 'imax', 'extended', 'directors', 'cut', 'unrated', 'remastered'],
+    'games': ['game', 'gaming', 'setup', 'install', 'launcher', 'steam', 'epic', 'origin', 'battle', 'playstation', 'xbox', 'nintendo', 'mod', 'patch', 'dlc', 'expansion', 'multiplayer', 'online', 'rpg', 'fps', 'strategy', 'puzzle', 'arcade', 'simulation', 'sports'],
+    'apps': ['app', 'application', 'software', 'program', 'tool', 'utility', 'installer', 'setup', 'exe', 'dmg', 'pkg', 'deb', 'rpm', 'snap', 'flatpak', 'portable', 'professional', 'enterprise', 'business', 'productivity', 'editor', 'browser', 'client'],
+    'entertainment': ['music', 'song', 'audio', 'video', 'entertainment', 'comedy', 'funny', 'viral', 'trending', 'podcast', 'stream', 'live', 'concert', 'album', 'playlist', 'mix', 'dance', 'party', 'show', 'series', 'episode', 'channel', 'youtube', 'tiktok', 'instagram'],
+    'career': ['resume', 'cv', 'career', 'job', 'work', 'professional', 'interview', 'application', 'cover', 'letter', 'linkedin', 'portfolio', 'project', 'skill', 'certification', 'training', 'development', 'management', 'leadership', 'performance', 'review', 'promotion', 'salary', 'negotiation'],
+    'finance': ['finance', 'financial', 'money', 'bank', 'banking', 'invoice', 'bill', 'receipt', 'statement', 'tax', 'salary', 'payroll', 'budget', 'expense', 'income', 'investment', 'stock', 'crypto', 'currency', 'loan', 'mortgage', 'insurance', 'audit', 'accounting'],
+    'others': ['temp', 'temporary', 'cache', 'data', 'config', 'system', 'log', 'backup', 'archive', 'database', 'misc', 'other', 'unknown', 'file', 'document', 'folder', 'directory', 'settings', 'preferences', 'metadata', 'info', 'readme', 'license', 'changelog']
+}
+
+# Extension matches - match training data
+CATEGORY_EXTENSIONS = {
+    'education': ['.pdf', '.docx', '.pptx', '.txt', '.doc', '.ppt', '.rtf', '.tex', '.epub', '.bib'],
+    'movies': ['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mpg', '.mpeg'],
+    'games': ['.exe', '.zip', '.rar', '.7z', '.iso', '.msi', '.apk', '.dmg', '.pkg', '.deb'],
+    'apps': ['.exe', '.msi', '.dmg', '.pkg', '.deb', '.rpm', '.snap', '.flatpak', '.appimage', '.tar.gz'],
+    'entertainment': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma', '.mp4', '.webm', '.mkv'],
+    'career': ['.pdf', '.docx', '.doc', '.txt', '.rtf', '.odt'],
+    'finance': ['.pdf', '.xlsx', '.xls', '.csv', '.txt', '.docx'],
+    'others': ['.dat', '.bin', '.tmp', '.log', '.cfg', '.ini', '.xml', '.json', '.db', '.sqlite', '.bak', '.old']
+}
+
+# Extensions that map to a single category with overwhelming support in
+# train.csv (P(category|ext) > 0.98 over at least 10 samples) and that belong
+# to only one category in CATEGORY_EXTENSIONS. These skip the forest entirely.
+EXTENSION_CATEGORY_LUT = {
+    '.avi': 'Movies',
+    '.iso': 'Games',
+    '.mp3': 'Entertainment',
+    '.wav': 'Entertainment',
+    '.pptx': 'Education',
+}
+
+# Precomputed per-category feature names and matchers for _file_features().
+# The compiled alternation rules out a category with one regex scan; the
+# exact count (distinct keywords contained in the name) only runs on a hit.
+_KEYWORD_MATCHERS = tuple(
+    (f'keywords_{category}', re.compile('|'.join(map(re.escape, keywords))).search, tuple(keywords))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+)
+_EXTENSION_SETS = tuple(
+    (f'ext_match_{category}', frozenset(extensions))
+    for category, extensions in CATEGORY_EXTENSIONS.items()
+)
+
+# Files per task when extract_features_batch() runs on several threads
+FEATURE_CHUNK_SIZE = 256
+
+# Child index sklearn uses to mark a leaf node
+TREE_LEAF = -1
+
+
+def _weighted_dfs_order(nodes: np.ndarray) -> np.ndarray:
+    """Return node indices in depth-first order, heavier child first."""
+    order = []
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        left = nodes['left_child'][node]
+        right = nodes['right_child'][node]
+        if left == TREE_LEAF:
+            continue
+        # Push the lighter child first so the heavier one is visited next
+        if nodes['n_node_samples'][left] >= nodes['n_node_samples'][right]:
+            stack.extend((right, left))
+        else:
+            stack.extend((left, right))
+    return np.asarray(order, dtype=np.int64)
+
+
 class RandomForestFileClassifier:
     """Random Forest based file classifier."""
     
@@ -37,6 +130,17 @@ class RandomForestFileClassifier:
         self.feature_names = []
         self.extension_mapping = {}  # Store extension to number mapping
         self.is_trained = False
+        self.onnx_session = None  # Optional ONNX Runtime session for inference
+        self.compiled_predictor = None  # Optional Treelite-compiled predictor
+        self._packed_forest = None  # Flattened tree arrays for predict_roundrobin()
+        self.threshold_edges = None  # Per-feature sorted split values when quantized
+        
+        # LRU cache of predictions keyed by the bytes of the encoded feature
+        # vector, so a hit skips only the forest and is always exact; the
+        # lock makes it safe to share between threads
+        self.prediction_cache_size = 4096
+        self._prediction_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._prediction_cache_lock = threading.Lock()
         
         # Categories mapping
         self.categories = {
@@ -124,6 +228,8 @@ class RandomForestFileClassifier:
         print("🔄 Training Random Forest...")
         self.rf_model.fit(X_train, y_train)
         self.is_trained = True
+        self.optimize_tree_layout()
+        self.clear_prediction_cache()
         
         # Evaluate model
         print("📋 Evaluating model...")
@@ -176,19 +282,19 @@ class RandomForestFileClassifier:
             'n_features': len(self.feature_names)
         }
     
-    def extract_features_from_file(self, file_path: str) -> pd.DataFrame:
+    def _file_features(self, file_path: str) -> Dict:
         """
-        Extract features from a real file for prediction - matches training format exactly.
+        Build the raw feature dictionary for a single file.
         
         Args:
             file_path: Path to the file
             
         Returns:
-            Feature DataFrame with proper column names
+            Feature dictionary keyed by training column name
         """
-        filename = os.path.basename(file_path)
-        name_without_ext = os.path.splitext(filename)[0].lower()
-        extension = os.path.splitext(filename)[1].lower()
+        name_without_ext, extension = os.path.splitext(os.path.basename(file_path))
+        name_without_ext = name_without_ext.lower()
+        extension = extension.lower()
         
         try:
             size_bytes = os.path.getsize(file_path)
@@ -207,41 +313,6 @@ class RandomForestFileClassifier:
         else:
             size_category = 4  # huge
         
-        # Keywords for each category - match training data
-        category_keywords = {
-            'education': ['assignment', 'notes', 'class', 'syllabus', 'exam', 'lecture', 'worksheet', 'college', 'study', 'textbook', 'tutorial', 'course', 'homework', 'quiz', 'test', 'university', 'school', 'academic', 'research', 'thesis', 'dissertation', 'math', 'science', 'biology', 'chemistry', 'physics', 'computer', 'programming', 'algorithm', 'data', 'statistics'],
-            'movies': ['movie', 'film', 'trailer', 'cinema', 'hd', 'bluray', 'dvd', '4k', 'action', 'comedy', 'drama', 'horror', 'thriller', 'adventure', 'fantasy', 'scifi', 'romance', 'animation', 'documentary', 'imax', 'extended', 'directors', 'cut', 'unrated', 'remastered'],
-            'games': ['game', 'gaming', 'setup', 'install', 'launcher', 'steam', 'epic', 'origin', 'battle', 'playstation', 'xbox', 'nintendo', 'mod', 'patch', 'dlc', 'expansion', 'multiplayer', 'online', 'rpg', 'fps', 'strategy', 'puzzle', 'arcade', 'simulation', 'sports'],
-            'apps': ['app', 'application', 'software', 'program', 'tool', 'utility', 'installer', 'setup', 'exe', 'dmg', 'pkg', 'deb', 'rpm', 'snap', 'flatpak', 'portable', 'professional', 'enterprise', 'business', 'productivity', 'editor', 'browser', 'client'],
-            'entertainment': ['music', 'song', 'audio', 'video', 'entertainment', 'comedy', 'funny', 'viral', 'trending', 'podcast', 'stream', 'live', 'concert', 'album', 'playlist', 'mix', 'dance', 'party', 'show', 'series', 'episode', 'channel', 'youtube', 'tiktok', 'instagram'],
-            'career': ['resume', 'cv', 'career', 'job', 'work', 'professional', 'interview', 'application', 'cover', 'letter', 'linkedin', 'portfolio', 'project', 'skill', 'certification', 'training', 'development', 'management', 'leadership', 'performance', 'review', 'promotion', 'salary', 'negotiation'],
-            'finance': ['finance', 'financial', 'money', 'bank', 'banking', 'invoice', 'bill', 'receipt', 'statement', 'tax', 'salary', 'payroll', 'budget', 'expense', 'income', 'investment', 'stock', 'crypto', 'currency', 'loan', 'mortgage', 'insurance', 'audit', 'accounting'],
-            'others': ['temp', 'temporary', 'cache', 'data', 'config', 'system', 'log', 'backup', 'archive', 'database', 'misc', 'other', 'unknown', 'file', 'document', 'folder', 'directory', 'settings', 'preferences', 'metadata', 'info', 'readme', 'license', 'changelog']
-        }
-        
-        # Extension matches - match training data
-        category_extensions = {
-            'education': ['.pdf', '.docx', '.pptx', '.txt', '.doc', '.ppt', '.rtf', '.tex', '.epub', '.bib'],
-            'movies': ['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mpg', '.mpeg'],
-            'games': ['.exe', '.zip', '.rar', '.7z', '.iso', '.msi', '.apk', '.dmg', '.pkg', '.deb'],
-            'apps': ['.exe', '.msi', '.dmg', '.pkg', '.deb', '.rpm', '.snap', '.flatpak', '.appimage', '.tar.gz'],
-            'entertainment': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma', '.mp4', '.webm', '.mkv'],
-            'career': ['.pdf', '.docx', '.doc', '.txt', '.rtf', '.odt'],
-            'finance': ['.pdf', '.xlsx', '.xls', '.csv', '.txt', '.docx'],
-            'others': ['.dat', '.bin', '.tmp', '.log', '.cfg', '.ini', '.xml', '.json', '.db', '.sqlite', '.bak', '.old']
-        }
-        
-        # Count keywords for each category
-        keyword_counts = {}
-        for category, keywords in category_keywords.items():
-            count = sum(1 for keyword in keywords if keyword in name_without_ext)
-            keyword_counts[f'keywords_{category}'] = count
-        
-        # Extension matches for each category
-        ext_matches = {}
-        for category, extensions in category_extensions.items():
-            ext_matches[f'ext_match_{category}'] = 1 if extension in extensions else 0
-        
         # Create feature dictionary
         features = {
             'extension': extension,
@@ -251,15 +322,25 @@ class RandomForestFileClassifier:
             'has_numbers': 1 if any(c.isdigit() for c in name_without_ext) else 0,
             'has_underscore': name_without_ext.count('_'),
             'has_dash': name_without_ext.count('-'),
-            'word_count': len([w for w in name_without_ext.replace('_', ' ').replace('-', ' ').split() if w])
+            'word_count': len(name_without_ext.replace('_', ' ').replace('-', ' ').split())
         }
         
-        # Add keyword and extension features
-        features.update(keyword_counts)
-        features.update(ext_matches)
+        # Count keywords for each category
+        for key, search, keywords in _KEYWORD_MATCHERS:
+            if search(name_without_ext):
+                features[key] = sum(1 for keyword in keywords if keyword in name_without_ext)
+            else:
+                features[key] = 0
+        
+        # Extension matches for each category
+        for key, extensions in _EXTENSION_SETS:
+            features[key] = 1 if extension in extensions else 0
         
-        # Convert to DataFrame with proper column names
-        df = pd.DataFrame([features])
+        return features
+    
+    def _features_to_frame(self, feature_rows: List[Dict]) -> pd.DataFrame:
+        """Convert raw feature dictionaries to a DataFrame in training column order."""
+        df = pd.DataFrame(feature_rows)
         
         # Ensure all training columns are present
         for col in self.feature_names:
@@ -275,35 +356,87 @@ class RandomForestFileClassifier:
         
         return df
     
-    def predict(self, file_path: str) -> Dict:
+    def _encode_features(self, features: Dict) -> np.ndarray:
+        """Encode a raw feature dictionary as a vector in training column order."""
+        row = np.zeros(len(self.feature_names), dtype=np.float64)
+        for i, col in enumerate(self.feature_names):
+            if col == 'extension':
+                row[i] = self.extension_mapping.get(features.get(col), -1)
+            else:
+                row[i] = features.get(col, 0)
+        return row
+    
+    def extract_features(self, file_path: str) -> np.ndarray:
         """
-        Predict the folder category for a file.
+        Extract the encoded feature vector for a file.
+        
+        The vector can be passed to predict_features() any number of times,
+        e.g. to re-classify after a model reload without touching the file.
         
         Args:
             file_path: Path to the file
             
         Returns:
-            Prediction dictionary with category and confidence
+            1-D feature array in training column order
         """
-        if not self.is_trained:
-            raise ValueError("Model not trained. Call train() first or load_model().")
+        return self._encode_features(self._file_features(file_path))
+    
+    def extract_features_from_file(self, file_path: str) -> pd.DataFrame:
+        """
+        Extract features from a real file for prediction - matches training format exactly.
         
-        # Extract features
-        features_df = self.extract_features_from_file(file_path)
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Feature DataFrame with proper column names
+        """
+        return self._features_to_frame([self._file_features(file_path)])
+    
+    def extract_features_batch(self, file_paths: List[str],
+                               max_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract features for many files into a single feature matrix.
         
-        # Get prediction probabilities
-        probabilities = self.rf_model.predict_proba(features_df)[0]
+        Args:
+            file_paths: List of file paths
+            max_workers: Extract chunks of files on this many threads. The
+                stat per file releases the GIL, so this pays off when it is
+                slow (network shares); the string work itself stays serial.
+            
+        Returns:
+            Feature DataFrame with one row per file, in input order
+        """
+        if max_workers and max_workers > 1 and len(file_paths) > FEATURE_CHUNK_SIZE:
+            chunks = [file_paths[i:i + FEATURE_CHUNK_SIZE]
+                      for i in range(0, len(file_paths), FEATURE_CHUNK_SIZE)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                rows = [row for chunk_rows in executor.map(self._extract_chunk, chunks)
+                        for row in chunk_rows]
+        else:
+            rows = self._extract_chunk(file_paths)
+        return pd.DataFrame(np.vstack(rows), columns=self.feature_names)
+    
+    def _extract_chunk(self, file_paths: List[str]) -> List[np.ndarray]:
+        """Extract feature vectors for a list of files."""
+        return [self.extract_features(path) for path in file_paths]
+    
+    def _build_prediction(self, file_path: str, probabilities: np.ndarray) -> Dict:
+        """Build a prediction dictionary from one row of class probabilities."""
+        # Index classes_ directly; inverse_transform re-validates its input
+        # on every call and dominated batch predictions
+        classes = self.label_encoder.classes_
         
         # Get predicted class
         predicted_class_idx = np.argmax(probabilities)
-        predicted_class = self.label_encoder.inverse_transform([predicted_class_idx])[0]
+        predicted_class = classes[predicted_class_idx]
         
         # Convert Finance to Education (simplification for better UX)
         if predicted_class == 'Finance':
             predicted_class = 'Education'
             # Find Education class index for confidence
             try:
-                education_idx = list(self.label_encoder.classes_).index('Education')
+                education_idx = list(classes).index('Education')
                 confidence = probabilities[education_idx]
             except ValueError:
                 confidence = probabilities[predicted_class_idx]
@@ -312,8 +445,7 @@ class RandomForestFileClassifier:
         
         # Create probability dictionary
         prob_dict = {}
-        for i, class_name in enumerate(self.label_encoder.classes_):
-            actual_name = self.label_encoder.inverse_transform([i])[0]
+        for i, actual_name in enumerate(classes):
             # Convert Finance probabilities to Education
             if actual_name == 'Finance':
                 if 'Education' in prob_dict:
@@ -331,51 +463,344 @@ class RandomForestFileClassifier:
             'all_probabilities': prob_dict
         }
     
-    def predict_batch(self, file_paths: List[str]) -> List[Dict]:
+    def _predict_proba(self, features) -> np.ndarray:
+        """Run the forest on a feature matrix, using the fastest loaded backend."""
+        matrix = features.to_numpy() if isinstance(features, pd.DataFrame) else features
+        if self.compiled_predictor is not None:
+            dmat = tl2cgen.DMatrix(matrix.astype(np.float32))
+            probabilities = self.compiled_predictor.predict(dmat)
+            return probabilities.reshape(len(matrix), -1)
+        if self.onnx_session is not None:
+            input_name = self.onnx_session.get_inputs()[0].name
+            return self.onnx_session.run(None, {input_name: matrix.astype(np.float32)})[1]
+        if len(matrix) == 1:
+            return self.predict_roundrobin(matrix[0])[np.newaxis, :]
+        if not isinstance(features, pd.DataFrame):
+            features = pd.DataFrame(matrix, columns=self.feature_names)
+        return self.rf_model.predict_proba(features)
+    
+    def _pack_forest(self) -> Dict:
+        """Flatten all trees into shared structure-of-arrays for traversal."""
+        lefts, rights, features, thresholds, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in self.rf_model.estimators_:
+            tree = estimator.tree_
+            left = tree.children_left.astype(np.int32)
+            right = tree.children_right.astype(np.int32)
+            is_split = left != TREE_LEAF
+            left[is_split] += offset
+            right[is_split] += offset
+            
+            # Leaf class distributions, normalised like DecisionTreeClassifier.predict_proba
+            value = tree.value[:, 0, :].astype(np.float64)
+            totals = value.sum(axis=1, keepdims=True)
+            totals[totals == 0] = 1.0
+            
+            lefts.append(left)
+            rights.append(right)
+            features.append(tree.feature.astype(np.int32))
+            thresholds.append(tree.threshold)
+            values.append(value / totals)
+            roots.append(offset)
+            offset += tree.node_count
+        
+        forest = {
+            'left': np.concatenate(lefts),
+            'right': np.concatenate(rights),
+            'feature': np.maximum(np.concatenate(features), 0),
+            'threshold': np.concatenate(thresholds),
+            'value': np.concatenate(values),
+            'roots': np.asarray(roots, dtype=np.int32),
+        }
+        
+        if self.threshold_edges is not None:
+            # Replace each split threshold by its rank among its feature's thresholds
+            qthreshold = np.zeros(len(forest['threshold']), dtype=np.int16)
+            is_split = forest['left'] != TREE_LEAF
+            for j, edges in enumerate(self.threshold_edges):
+                mask = is_split & (forest['feature'] == j)
+                qthreshold[mask] = np.searchsorted(edges, forest['threshold'][mask])
+            forest['threshold'] = qthreshold
+        
+        return forest
+    
+    def predict_roundrobin(self, feature_row: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities for one sample, advancing all trees a level at a time.
+        
+        Every step gathers the current node of each tree at once, so the
+        independent memory loads overlap instead of walking tree 0 to a leaf
+        before starting tree 1.
+        
+        Args:
+            feature_row: Feature values in training column order
+            
+        Returns:
+            Probability for each class, averaged over the forest
+        """
+        if self._packed_forest is None:
+            self._packed_forest = self._pack_forest()
+        forest = self._packed_forest
+        
+        # sklearn compares float32 features against float64 thresholds
+        x = np.asarray(feature_row, dtype=np.float32).astype(np.float64)
+        if self.threshold_edges is not None:
+            x = np.array([np.searchsorted(edges, v) for edges, v in zip(self.threshold_edges, x)],
+                         dtype=np.int16)
+        left, right = forest['left'], forest['right']
+        feature, threshold = forest['feature'], forest['threshold']
+        
+        current = forest['roots'].copy()
+        active = np.ones(len(current), dtype=bool)
+        while True:
+            active &= left[current] != TREE_LEAF
+            if not active.any():
+                break
+            nodes = current[active]
+            go_left = x[feature[nodes]] <= threshold[nodes]
+            current[active] = np.where(go_left, left[nodes], right[nodes])
+        
+        return forest['value'][current].mean(axis=0)
+    
+    def predict_from_extension(self, file_path: str) -> Optional[Dict]:
+        """
+        Classify a file by extension alone when the extension is unambiguous.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Prediction dictionary, or None if the forest is needed
+        """
+        category = EXTENSION_CATEGORY_LUT.get(os.path.splitext(file_path)[1].lower())
+        if category is None:
+            return None
+        
+        return {
+            'filename': os.path.basename(file_path),
+            'predicted_category': category,
+            'folder_name': self.get_folder_name(category),
+            'confidence': 1.0,
+            'all_probabilities': {category: 1.0},
+            'route': 'lut'
+        }
+    
+    def _cache_get(self, key: bytes, file_path: str) -> Optional[Dict]:
+        """Return a cached prediction re-labelled for file_path, if present."""
+        with self._prediction_cache_lock:
+            cached = self._prediction_cache.get(key)
+            if cached is None:
+                return None
+            self._prediction_cache.move_to_end(key)
+        result = dict(cached)
+        result['filename'] = os.path.basename(file_path)
+        return result
+    
+    def _cache_put(self, key: bytes, result: Dict):
+        """Store a prediction, evicting the least recently used entry."""
+        if 'error' in result:
+            return
+        with self._prediction_cache_lock:
+            self._prediction_cache[key] = result
+            self._prediction_cache.move_to_end(key)
+            if len(self._prediction_cache) > self.prediction_cache_size:
+                self._prediction_cache.popitem(last=False)
+    
+    def clear_prediction_cache(self):
+        """Drop all cached predictions (call after the model changes)."""
+        with self._prediction_cache_lock:
+            self._prediction_cache.clear()
+    
+    def predict(self, file_path: str, use_cache: bool = False) -> Dict:
+        """
+        Predict the folder category for a file.
+        
+        Args:
+            file_path: Path to the file
+            use_cache: Reuse the prediction of an earlier file with the
+                same feature vector
+            
+        Returns:
+            Prediction dictionary with category and confidence
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained. Call train() first or load_model().")
+        
+        features = self.extract_features(file_path)
+        if use_cache:
+            key = features.tobytes()
+            result = self._cache_get(key, file_path)
+            if result is None:
+                result = self.predict_features(features, file_path)
+                self._cache_put(key, result)
+            return result
+        
+        return self.predict_features(features, file_path)
+    
+    def predict_features(self, features: np.ndarray, file_path: str) -> Dict:
+        """
+        Predict the folder category from an already extracted feature vector.
+        
+        Args:
+            features: Vector returned by extract_features()
+            file_path: Path of the file the features describe
+            
+        Returns:
+            Prediction dictionary with category and confidence
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained. Call train() first or load_model().")
+        
+        probabilities = self._predict_proba(np.asarray(features)[np.newaxis, :])[0]
+        return self._build_prediction(file_path, probabilities)
+    
+    def predict_batch(self, file_paths: List[str], use_cache: bool = False,
+                      max_workers: Optional[int] = None) -> List[Dict]:
         """
         Predict categories for multiple files.
         
+        All files are stacked into one feature matrix so the forest is
+        evaluated with a single predict_proba call instead of once per file.
+        
         Args:
             file_paths: List of file paths
+            use_cache: Serve files whose feature vector was seen before from
+                the prediction cache and only send misses to the forest
+            max_workers: Threads for feature extraction, see
+                extract_features_batch()
             
         Returns:
             List of prediction dictionaries
         """
-        results = []
-        for file_path in file_paths:
-            try:
-                result = self.predict(file_path)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    'filename': os.path.basename(file_path),
-                    'predicted_category': 'Others',
-                    'confidence': 0.0,
-                    'error': str(e)
-                })
+        if not file_paths:
+            return []
+        
+        try:
+            if not self.is_trained:
+                raise ValueError("Model not trained. Call train() first or load_model().")
+            
+            features_df = self.extract_features_batch(file_paths, max_workers)
+            if use_cache:
+                return self._predict_cached(file_paths, features_df.to_numpy())
+            probabilities = self._predict_proba(features_df)
+        except Exception as e:
+            return [{
+                'filename': os.path.basename(file_path),
+                'predicted_category': 'Others',
+                'confidence': 0.0,
+                'error': str(e)
+            } for file_path in file_paths]
+        
+        return [self._build_prediction(file_path, row)
+                for file_path, row in zip(file_paths, probabilities)]
+    
+    def _predict_cached(self, file_paths: List[str], matrix: np.ndarray) -> List[Dict]:
+        """Predict feature rows, evaluating the forest only for unseen vectors."""
+        keys = [row.tobytes() for row in matrix]
+        results = [self._cache_get(key, path) for key, path in zip(keys, file_paths)]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            probabilities = self._predict_proba(matrix[misses])
+            for i, row in zip(misses, probabilities):
+                results[i] = self._build_prediction(file_paths[i], row)
+                self._cache_put(keys[i], results[i])
         return results
     
-    def save_model(self, model_path: str = 'rf_file_classifier.joblib'):
-        """Save trained model to disk."""
+    def optimize_tree_layout(self):
+        """
+        Reorder every tree's nodes along a sample-weighted depth-first walk.
+        
+        At each split the child that saw more training samples is laid out
+        directly after its parent, so the most likely path through a tree is
+        contiguous in memory. Predictions are unchanged.
+        """
+        for estimator in self.rf_model.estimators_:
+            tree = estimator.tree_
+            state = tree.__getstate__()
+            nodes = state['nodes']
+            
+            order = _weighted_dfs_order(nodes)
+            new_index = np.empty(len(order), dtype=np.int64)
+            new_index[order] = np.arange(len(order))
+            
+            new_nodes = nodes[order].copy()
+            is_split = new_nodes['left_child'] != TREE_LEAF
+            new_nodes['left_child'][is_split] = new_index[new_nodes['left_child'][is_split]]
+            new_nodes['right_child'][is_split] = new_index[new_nodes['right_child'][is_split]]
+            
+            state['nodes'] = new_nodes
+            state['values'] = state['values'][order].copy()
+            tree.__setstate__(state)
+        
+        self._packed_forest = None
+    
+    def quantize_thresholds(self):
+        """
+        Switch predict_roundrobin() to int16 threshold comparisons.
+        
+        Each feature's split thresholds are replaced by their rank among the
+        unique thresholds used on that feature, and incoming values are mapped
+        to the number of thresholds strictly below them. x <= t_k holds exactly
+        when rank(x) <= k, so predictions are unchanged while each node visit
+        reads two bytes instead of eight.
+        """
+        n_features = len(self.feature_names)
+        per_feature = [[] for _ in range(n_features)]
+        for estimator in self.rf_model.estimators_:
+            tree = estimator.tree_
+            is_split = tree.children_left != TREE_LEAF
+            for j, t in zip(tree.feature[is_split], tree.threshold[is_split]):
+                per_feature[j].append(t)
+        
+        edges = [np.unique(np.asarray(ts, dtype=np.float64)) for ts in per_feature]
+        if max(len(e) for e in edges) > np.iinfo(np.int16).max:
+            raise ValueError("Too many distinct thresholds to quantize to int16")
+        
+        self.threshold_edges = edges
+        self._packed_forest = None
+    
+    def save_model(self, model_path: str = 'rf_file_classifier.joblib', quantized: bool = False):
+        """
+        Save trained model to disk.
+        
+        Args:
+            model_path: Destination joblib file
+            quantized: Also store the int16 threshold tables used by predict_roundrobin()
+        """
         if not self.is_trained:
             print("❌ No trained model to save!")
             return
         
+        if quantized and self.threshold_edges is None:
+            self.quantize_thresholds()
+        
         model_data = {
             'rf_model': self.rf_model,
             'label_encoder': self.label_encoder,
             'feature_names': self.feature_names,
             'extension_mapping': self.extension_mapping,
-            'categories': self.categories
+            'categories': self.categories,
+            'tree_layout': 'wdfs'
         }
+        if quantized:
+            model_data['threshold_edges'] = self.threshold_edges
         
         joblib.dump(model_data, model_path)
         print(f"💾 Model saved to {model_path}")
     
-    def load_model(self, model_path: str = 'rf_file_classifier.joblib'):
-        """Load trained model from disk."""
+    def load_model(self, model_path: str = 'rf_file_classifier.joblib',
+                   mmap_mode: Optional[str] = None):
+        """
+        Load trained model from disk.
+        
+        Args:
+            model_path: Path to a model saved by save_model()
+            mmap_mode: Passed to joblib.load; 'r' memory-maps the stored
+                arrays instead of reading them into memory, which helps
+                for very large forests shared between processes
+        """
         try:
-            model_data = joblib.load(model_path)
+            model_data = joblib.load(model_path, mmap_mode=mmap_mode)
             
             self.rf_model = model_data['rf_model']
             self.label_encoder = model_data['label_encoder']
@@ -383,12 +808,148 @@ class RandomForestFileClassifier:
             self.extension_mapping = model_data.get('extension_mapping', {})
             self.categories = model_data['categories']
             self.is_trained = True
+            self._packed_forest = None
+            self.threshold_edges = model_data.get('threshold_edges')
+            
+            # Older model files store trees in sklearn's build order
+            if model_data.get('tree_layout') != 'wdfs':
+                self.optimize_tree_layout()
+            self.clear_prediction_cache()
             
             print(f"📚 Model loaded from {model_path}")
             
         except Exception as e:
             print(f"❌ Failed to load model: {e}")
     
+    def export_onnx(self, onnx_path: str = 'rf_file_classifier.onnx') -> bool:
+        """
+        Convert the trained forest to ONNX for faster inference.
+        
+        Requires the optional skl2onnx package.
+        
+        Args:
+            onnx_path: Destination path for the ONNX model
+            
+        Returns:
+            True if the model was exported
+        """
+        if not self.is_trained:
+            print("❌ No trained model to export!")
+            return False
+        
+        try:
+            from skl2onnx import convert_sklearn
+            from skl2onnx.common.data_types import FloatTensorType
+        except ImportError:
+            print("⚠️ skl2onnx not installed, skipping ONNX export")
+            return False
+        
+        onnx_model = convert_sklearn(
+            self.rf_model,
+            initial_types=[('input', FloatTensorType([None, len(self.feature_names)]))],
+            options={id(self.rf_model): {'zipmap': False}}
+        )
+        with open(onnx_path, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+        
+        print(f"💾 ONNX model saved to {onnx_path}")
+        return True
+    
+    def load_onnx(self, onnx_path: str = 'rf_file_classifier.onnx') -> bool:
+        """
+        Route predictions through an ONNX Runtime session.
+        
+        Falls back to the joblib model if onnxruntime is missing or the
+        file cannot be loaded.
+        
+        Args:
+            onnx_path: Path to an ONNX model exported by export_onnx()
+            
+        Returns:
+            True if the ONNX session is active
+        """
+        if ort is None or not os.path.exists(onnx_path):
+            return False
+        
+        try:
+            self.onnx_session = ort.InferenceSession(
+                onnx_path, providers=['CPUExecutionProvider']
+            )
+            self.clear_prediction_cache()
+            print(f"⚡ ONNX model loaded from {onnx_path}")
+            return True
+        except Exception as e:
+            self.onnx_session = None
+            print(f"⚠️ Failed to load ONNX model, using joblib model: {e}")
+            return False
+    
+    def export_compiled(self, lib_path: str = 'rf_file_classifier' + COMPILED_MODEL_SUFFIX,
+                        toolchain: Optional[str] = None) -> bool:
+        """
+        Compile the trained forest to a native shared library with Treelite.
+        
+        Requires the optional treelite and tl2cgen packages and a C compiler.
+        
+        Args:
+            lib_path: Destination path for the shared library
+            toolchain: Compiler to use (default: msvc on Windows, clang on macOS, gcc elsewhere)
+            
+        Returns:
+            True if the library was built
+        """
+        if not self.is_trained:
+            print("❌ No trained model to compile!")
+            return False
+        
+        try:
+            import treelite
+        except ImportError:
+            print("⚠️ treelite not installed, skipping native compilation")
+            return False
+        if tl2cgen is None:
+            print("⚠️ tl2cgen not installed, skipping native compilation")
+            return False
+        
+        if toolchain is None:
+            toolchain = {'win32': 'msvc', 'darwin': 'clang'}.get(sys.platform, 'gcc')
+        
+        try:
+            model = treelite.sklearn.import_model(self.rf_model)
+            tl2cgen.export_lib(model, toolchain=toolchain, libpath=lib_path,
+                               params={'parallel_comp': 8})
+        except Exception as e:
+            print(f"❌ Failed to compile model: {e}")
+            return False
+        
+        print(f"💾 Compiled model saved to {lib_path}")
+        return True
+    
+    def load_compiled(self, lib_path: str = 'rf_file_classifier' + COMPILED_MODEL_SUFFIX) -> bool:
+        """
+        Route predictions through a Treelite-compiled shared library.
+        
+        Falls back to the other backends if tl2cgen is missing or the
+        library cannot be loaded.
+        
+        Args:
+            lib_path: Path to a library built by export_compiled()
+            
+        Returns:
+            True if the compiled predictor is active
+        """
+        if tl2cgen is None or not os.path.exists(lib_path):
+            return False
+        
+        try:
+            self.compiled_predictor = tl2cgen.Predictor(lib_path)
+            self.clear_prediction_cache()
+            print(f"⚡ Compiled model loaded from {lib_path}")
+            return True
+        except Exception as e:
+            self.compiled_predictor = None
+            print(f"⚠️ Failed to load compiled model: {e}")
+            return False
+    
     def get_feature_importance(self) -> Dict:
         """Get feature importance from trained model."""
         if not self.is_trained:
@@ -427,6 +988,8 @@ def main():
     
     # Save model
     classifier.save_model()
+    classifier.export_onnx()
+    classifier.export_compiled()
     
     # Test with some example predictions
     print(f"\n🧪 Testing Predictions:")